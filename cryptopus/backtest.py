@@ -1,8 +1,23 @@
-from datetime import datetime, timezone
+import threading
+from datetime import datetime
 from typing import List, Optional
 
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit  # type: ignore
+except Exception:
+    njit = None
+
 
 class BacktestResult:
+    # Slots drop the per-instance __dict__; the lazy timestamps cache keeps
+    # this a plain class rather than a frozen dataclass.
+    __slots__ = ("start_cash", "end_cash", "trades", "wins", "max_dd",
+                 "equity_curve", "drawdowns", "_timestamps", "timestamps_ms",
+                 "buy_hold_curve", "_date_nums")
+
     def __init__(
         self,
         start_cash: float,
@@ -10,10 +25,11 @@ class BacktestResult:
         trades: int,
         wins: int,
         max_dd: float,
-        equity_curve: List[float],
-        drawdowns: List[float],
-        timestamps: List[datetime],
-        buy_hold_curve: Optional[List[float]] = None,
+        equity_curve: np.ndarray,
+        drawdowns: np.ndarray,
+        timestamps: Optional[List[datetime]] = None,
+        buy_hold_curve: Optional[np.ndarray] = None,
+        timestamps_ms: Optional[np.ndarray] = None,
     ) -> None:
         self.start_cash = start_cash
         self.end_cash = end_cash
@@ -22,8 +38,26 @@ class BacktestResult:
         self.max_dd = max_dd
         self.equity_curve = equity_curve
         self.drawdowns = drawdowns
-        self.timestamps = timestamps
-        self.buy_hold_curve = buy_hold_curve or []
+        self._timestamps = timestamps
+        self.timestamps_ms = timestamps_ms
+        # Matplotlib date numbers, filled in by the plotting layer on first
+        # use so repeat plots of a cached result skip the conversion.
+        self._date_nums: Optional[np.ndarray] = None
+        self.buy_hold_curve = buy_hold_curve if buy_hold_curve is not None else []
+
+    @property
+    def timestamps(self) -> List[datetime]:
+        """Bar datetimes, built from the raw ms column on first use.
+
+        Only the plots consume datetimes, so headless runs (Compare table,
+        parameter sweeps) never pay for the conversion.
+        """
+        if self._timestamps is None:
+            if self.timestamps_ms is not None:
+                self._timestamps = self.timestamps_ms.astype("datetime64[ms]").tolist()
+            else:
+                self._timestamps = []
+        return self._timestamps
 
     @property
     def return_pct(self) -> float:
@@ -36,6 +70,200 @@ class BacktestResult:
         return (self.wins / self.trades * 100) if self.trades else 0.0
 
 
+def _compute_signals(arr: np.ndarray, strategy, cache: Optional[dict] = None) -> Optional[np.ndarray]:
+    """Vectorized per-bar signals for the built-in strategies.
+
+    Returns an int8 array aligned with ``arr`` rows (+1 buy, -1 sell, 0 hold),
+    where ``signals[i]`` matches ``strategy.evaluate(ohlcv[:i + 1])``.
+    Returns None for strategies without a vectorized equivalent; the caller
+    falls back to per-bar evaluation. ``cache`` memoizes rolling windows so
+    overlapping runs over the same OHLCV (e.g. the Compare tab) compute each
+    indicator once.
+    """
+    n = len(arr)
+    highs = arr[:, 2]
+    lows = arr[:, 3]
+    closes = arr[:, 4]
+    signals = np.zeros(n, dtype=np.int8)
+    name = getattr(strategy, "name", "")
+
+    def memo(key, fn):
+        if cache is None:
+            return fn()
+        value = cache.get(key)
+        if value is None:
+            value = cache[key] = fn()
+        return value
+
+    if name == "Momentum":
+        w = strategy.window
+        if n < w:
+            return signals
+        first = closes[: n - w + 1]
+        last = closes[w - 1:]
+        up = 1 + strategy.threshold_pct / 100
+        down = 1 - strategy.threshold_pct / 100
+        signals[w - 1:] = np.where(last > first * up, 1,
+                                   np.where(last < first * down, -1, 0))
+        return signals
+
+    if name == "Mean Reversion":
+        w = strategy.window
+        if n < w:
+            return signals
+        def rolling_mean():
+            # Window means via cumulative sums: two indexed subtractions per
+            # window instead of a fresh reduction.
+            cs = np.concatenate(([0.0], np.cumsum(closes)))
+            return (cs[w:] - cs[:-w]) / w
+
+        means = memo(("mean_close", w), rolling_mean)
+        last = closes[w - 1:]
+        buy_thresh = 1 - strategy.threshold_pct / 100
+        sell_thresh = 1 + strategy.threshold_pct / 100
+        signals[w - 1:] = np.where(last < means * buy_thresh, 1,
+                                   np.where(last > means * sell_thresh, -1, 0))
+        return signals
+
+    if name == "Breakout":
+        w = strategy.window
+        if n < w:
+            return signals
+        # Prior-window extremes exclude the current bar, matching highs[:-1].
+        prior_high = memo(("max_high", w - 1),
+                          lambda: sliding_window_view(highs[:-1], w - 1).max(axis=1))
+        prior_low = memo(("min_low", w - 1),
+                         lambda: sliding_window_view(lows[:-1], w - 1).min(axis=1))
+        last = closes[w - 1:]
+        up_buffer = 1 + strategy.buffer_pct / 100
+        down_buffer = 1 - strategy.buffer_pct / 100
+        signals[w - 1:] = np.where(last > prior_high * up_buffer, 1,
+                                   np.where(last < prior_low * down_buffer, -1, 0))
+        return signals
+
+    if name == "Scalping":
+        w = strategy.window
+        if n < w:
+            return signals
+        mins = memo(("min_close", w),
+                    lambda: sliding_window_view(closes, w).min(axis=1))
+        maxs = memo(("max_close", w),
+                    lambda: sliding_window_view(closes, w).max(axis=1))
+        spread = maxs - mins
+        last = closes[w - 1:]
+        band = strategy.band_pct / 100
+        buy = last <= mins + spread * band
+        sell = last >= maxs - spread * band
+        signals[w - 1:] = np.where(spread == 0, 0,
+                                   np.where(buy, 1, np.where(sell, -1, 0)))
+        return signals
+
+    if name == "Contra-Momentum":
+        if n < 2:
+            return signals
+        up = 1 + strategy.threshold_pct / 100
+        down = 1 - strategy.threshold_pct / 100
+        last = closes[1:]
+        prev = closes[:-1]
+        signals[1:] = np.where(last > prev * up, -1,
+                               np.where(last < prev * down, 1, 0))
+        return signals
+
+    return None
+
+
+def _run_kernel(highs, lows, closes, signals, start_cash,
+                fee_rate, slippage_pct, stop_loss_pct, take_profit_pct):
+    """Sequential cash/position state machine over precomputed signals.
+
+    The fill-to-fill dependency makes this loop irreducible to NumPy
+    reductions, so it is JIT-compiled with numba when available and runs
+    as plain Python otherwise.
+    """
+    n = len(closes)
+    m = n - 20 if n > 20 else 0
+    equity_curve = np.empty(m, dtype=np.float64)
+    drawdowns = np.empty(m, dtype=np.float64)
+    cash = start_cash
+    position = 0.0
+    entry_price = 0.0
+    trades = 0
+    wins = 0
+    peak = 0.0
+    max_dd = 0.0
+    slip_buy = 1 + slippage_pct / 100
+    slip_sell = 1 - slippage_pct / 100
+    # Hoist the risk constants: with SL/TP disabled (the Compare default)
+    # the whole block reduces to one boolean test per bar.
+    has_sl = stop_loss_pct > 0
+    has_tp = take_profit_pct > 0
+    use_risk = has_sl or has_tp
+    sl_mul = 1 - stop_loss_pct / 100
+    tp_mul = 1 + take_profit_pct / 100
+
+    for idx in range(20, n):
+        price = closes[idx]
+        high = highs[idx]
+        low = lows[idx]
+
+        # Check SL/TP on open positions
+        if use_risk and position > 0 and entry_price > 0:
+            sl_price = entry_price * sl_mul
+            tp_price = entry_price * tp_mul
+            if has_sl and low <= sl_price:
+                sell_price = sl_price * slip_sell
+                proceeds = position * sell_price
+                fee = proceeds * fee_rate
+                cash = proceeds - fee
+                if sell_price > entry_price:
+                    wins += 1
+                position = 0.0
+                trades += 1
+            elif has_tp and high >= tp_price:
+                sell_price = tp_price * slip_sell
+                proceeds = position * sell_price
+                fee = proceeds * fee_rate
+                cash = proceeds - fee
+                if sell_price > entry_price:
+                    wins += 1
+                position = 0.0
+                trades += 1
+
+        signal = signals[idx]
+        if signal == 1 and cash > 0 and position == 0:
+            buy_price = price * slip_buy
+            fee = cash * fee_rate
+            position = (cash - fee) / buy_price
+            entry_price = buy_price
+            cash = 0.0
+            trades += 1
+        elif signal == -1 and position > 0:
+            sell_price = price * slip_sell
+            proceeds = position * sell_price
+            fee = proceeds * fee_rate
+            cash = proceeds - fee
+            if sell_price > entry_price:
+                wins += 1
+            position = 0.0
+            trades += 1
+
+        equity = cash + position * price
+        equity_curve[idx - 20] = equity
+        if equity > peak:
+            peak = equity
+        dd = (peak - equity) / peak * 100 if peak else 0.0
+        drawdowns[idx - 20] = dd
+        if dd > max_dd:
+            max_dd = dd
+
+    end_cash = cash + position * closes[n - 1] if n else start_cash
+    return equity_curve, drawdowns, end_cash, trades, wins, max_dd
+
+
+if njit is not None:
+    _run_kernel = njit(cache=True, nogil=True, fastmath=True)(_run_kernel)
+
+
 class BacktestEngine:
     def __init__(self, fee_rate: float, slippage_pct: float = 0.0,
                  stop_loss_pct: float = 0.0, take_profit_pct: float = 0.0) -> None:
@@ -43,80 +271,61 @@ class BacktestEngine:
         self.slippage_pct = slippage_pct
         self.stop_loss_pct = stop_loss_pct
         self.take_profit_pct = take_profit_pct
+        # Single-entry cache of the converted array and rolling indicator
+        # windows for the most recent OHLCV input. Swapped wholesale (never
+        # cleared in place) so concurrent runs holding the old dict keep a
+        # consistent snapshot; the lock only guards the swap.
+        self._indicator_cache: dict = {}
+        self._cache_lock = threading.Lock()
+
+    def run(self, ohlcv, strategy, cash: float) -> BacktestResult:  # type: ignore[override]
+        """Backtest ``strategy`` over ``ohlcv`` starting from ``cash``.
+
+        ``ohlcv`` may be a ccxt-style list of [ts, o, h, l, c, v] rows or an
+        (N, 6) float64 ndarray; arrays are used as-is without copying.
+        """
+        key = (id(ohlcv), len(ohlcv), ohlcv[0][0], ohlcv[-1][0])
+        with self._cache_lock:
+            cache = self._indicator_cache
+            if cache.get("key") != key:
+                cache = {"key": key, "arr": np.asarray(ohlcv, dtype=np.float64)}
+                self._indicator_cache = cache
+        arr = cache["arr"]
+        ts_ms = arr[:, 0]
+        highs = arr[:, 2]
+        lows = arr[:, 3]
+        closes = arr[:, 4]
+
+        signals = _compute_signals(arr, strategy, cache)
+        if signals is None:
+            # Third-party strategy: fall back to per-bar evaluation. Grow one
+            # window list incrementally rather than copying ohlcv[:idx + 1]
+            # on every bar.
+            signals = np.zeros(len(arr), dtype=np.int8)
+            lookback = getattr(strategy, "lookback", 0)
+            window = list(ohlcv[:20])
+            for idx in range(20, len(ohlcv)):
+                window.append(ohlcv[idx])
+                if lookback and len(window) > 2 * lookback:
+                    del window[: len(window) - lookback]
+                sig = strategy.evaluate(window)
+                if sig == "buy":
+                    signals[idx] = 1
+                elif sig == "sell":
+                    signals[idx] = -1
 
-    def run(self, ohlcv: List[List[float]], strategy, cash: float) -> BacktestResult:  # type: ignore[override]
         start_cash = cash
-        position = 0.0
-        entry_price = 0.0
-        trades = 0
-        wins = 0
-        equity_curve: List[float] = []
-        buy_hold_curve: List[float] = []
-        timestamps: List[datetime] = []
-        drawdowns: List[float] = []
-        peak = 0.0
-        bh_start_price = ohlcv[20][4] if len(ohlcv) > 20 else ohlcv[0][4]
-
-        for idx in range(20, len(ohlcv)):
-            window = ohlcv[: idx + 1]
-            price = window[-1][4]
-            high = window[-1][2]
-            low = window[-1][3]
-
-            # Check SL/TP on open positions
-            if position > 0 and entry_price > 0 and (self.stop_loss_pct > 0 or self.take_profit_pct > 0):
-                sl_price = entry_price * (1 - self.stop_loss_pct / 100) if self.stop_loss_pct > 0 else 0
-                tp_price = entry_price * (1 + self.take_profit_pct / 100) if self.take_profit_pct > 0 else float("inf")
-                if sl_price > 0 and low <= sl_price:
-                    sell_price = sl_price * (1 - self.slippage_pct / 100)
-                    proceeds = position * sell_price
-                    fee = proceeds * self.fee_rate
-                    cash = proceeds - fee
-                    if sell_price > entry_price:
-                        wins += 1
-                    position = 0
-                    trades += 1
-                elif high >= tp_price:
-                    sell_price = tp_price * (1 - self.slippage_pct / 100)
-                    proceeds = position * sell_price
-                    fee = proceeds * self.fee_rate
-                    cash = proceeds - fee
-                    if sell_price > entry_price:
-                        wins += 1
-                    position = 0
-                    trades += 1
-
-            signal = strategy.evaluate(window)
-            if signal == "buy" and cash > 0 and position == 0:
-                buy_price = price * (1 + self.slippage_pct / 100)
-                fee = cash * self.fee_rate
-                position = (cash - fee) / buy_price
-                entry_price = buy_price
-                cash = 0
-                trades += 1
-            elif signal == "sell" and position > 0:
-                sell_price = price * (1 - self.slippage_pct / 100)
-                proceeds = position * sell_price
-                fee = proceeds * self.fee_rate
-                cash = proceeds - fee
-                if sell_price > entry_price:
-                    wins += 1
-                position = 0
-                trades += 1
+        equity_curve, drawdowns, end_cash, trades, wins, max_dd = _run_kernel(
+            highs, lows, closes, signals, start_cash,
+            self.fee_rate, self.slippage_pct, self.stop_loss_pct, self.take_profit_pct,
+        )
+
+        bh_start_price = closes[20] if len(arr) > 20 else closes[0]
+        if bh_start_price:
+            buy_hold_curve = start_cash * closes[20:] / bh_start_price
+        else:
+            buy_hold_curve = np.full(len(closes[20:]), start_cash)
 
-            equity = cash + position * price
-            equity_curve.append(equity)
-            bh_equity = start_cash * (price / bh_start_price) if bh_start_price else start_cash
-            buy_hold_curve.append(bh_equity)
-            if equity > peak:
-                peak = equity
-            drawdown = (peak - equity) / peak * 100 if peak else 0.0
-            drawdowns.append(drawdown)
-            ts = datetime.fromtimestamp(window[-1][0] / 1000, tz=timezone.utc)
-            timestamps.append(ts)
-
-        end_cash = cash + position * ohlcv[-1][4]
-        max_dd = max(drawdowns) if drawdowns else 0.0
         return BacktestResult(
             start_cash=start_cash,
             end_cash=end_cash,
@@ -125,6 +334,6 @@ class BacktestEngine:
             max_dd=max_dd,
             equity_curve=equity_curve,
             drawdowns=drawdowns,
-            timestamps=timestamps,
+            timestamps_ms=ts_ms[20:],
             buy_hold_curve=buy_hold_curve,
         )
@@ -1,6 +1,20 @@
+import json
+import os
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Shared pick-lists for the UI tabs and the CoinGecko fallback mapping.
+EXCHANGE_OPTIONS = ("coinbase", "kraken", "binance", "bybit", "alpaca")
+SYMBOL_OPTIONS = ("BTC/USD", "ETH/USD", "SOL/USD", "ADA/USD", "AVAX/USD")
+TIMEFRAME_OPTIONS = ("1m", "5m", "15m", "1h", "4h")
+COINGECKO_IDS = {
+    "btc": "bitcoin",
+    "eth": "ethereum",
+    "sol": "solana",
+    "ada": "cardano",
+    "avax": "avalanche-2",
+}
 
 
 @dataclass
@@ -10,6 +24,7 @@ class AppConfig:
     timeframe: str = "5m"
     live_trading: bool = False
     enable_websocket: bool = True
+    ws_ping_interval: int = 5
     trade_size: float = 0.001
     poll_seconds: int = 5
     max_daily_loss: float = 150.0
@@ -21,9 +36,10 @@ class AppConfig:
     use_atr_sizing: bool = False
     risk_per_trade_pct: float = 1.0
     backtest_slippage_pct: float = 0.05
+    debug_tracebacks: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     ts: datetime
     side: str
@@ -34,7 +50,7 @@ class Order:
     exchange_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     symbol: str
     amount: float = 0.0
@@ -63,3 +79,32 @@ def validate_config(data: Any, log_fn: Callable[[str], None]) -> Dict[str, Dict[
         if not isinstance(creds.get("secret", ""), str):
             log_fn(f"CONFIG WARNING: exchange '{name}' secret is not a string.")
     return exchanges
+
+
+# path -> (st_mtime_ns, validated exchanges)
+_validated_cache: Dict[str, Tuple[int, Dict[str, Dict[str, str]]]] = {}
+
+
+def load_validated_config(path: str, log_fn: Callable[[str], None]) -> Dict[str, Dict[str, str]]:
+    """Read and validate a config.json, memoized on file mtime.
+
+    Re-validating an unchanged file repeats the same O(N) walk and, worse,
+    re-logs the same warnings; the validated dict is reused until the file
+    changes on disk.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return {}
+    cached = _validated_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, OSError) as exc:
+        log_fn(f"Failed to read {path}: {exc}")
+        return {}
+    exchanges = validate_config(data, log_fn)
+    _validated_cache[path] = (mtime, exchanges)
+    return exchanges
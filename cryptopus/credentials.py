@@ -8,6 +8,8 @@ import json
 import os
 from typing import Callable, Dict, Optional
 
+from cryptopus.config import load_validated_config
+
 SERVICE_NAME = "cryptopus"
 
 try:
@@ -98,16 +100,10 @@ def migrate_from_config_json(
         _log("No API keys found. Add them in Settings > API Keys.")
         return {}
 
-    try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, OSError) as exc:
-        _log(f"Failed to read config.json: {exc}")
-        return {}
-
-    exchanges = data.get("exchanges", {})
-    if not isinstance(exchanges, dict):
-        _log("CONFIG WARNING: 'exchanges' in config.json is not a dict.")
+    # Shared read+validate path; memoized on mtime so repeated loads of an
+    # unchanged file neither re-walk nor re-log the same warnings.
+    exchanges = load_validated_config(config_path, _log)
+    if not exchanges:
         return {}
 
     # Filter out placeholder keys
@@ -1,7 +1,12 @@
+import importlib.util
+import threading
 import time
 import traceback
+from collections import OrderedDict
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 try:
     import ccxt  # type: ignore
 except Exception:
@@ -12,17 +17,17 @@ try:
 except Exception:
     requests = None
 
-try:
-    import websocket as _ws_module  # type: ignore
-except Exception:
-    _ws_module = None
-
-from cryptopus.config import AppConfig
+from cryptopus.config import AppConfig, COINGECKO_IDS
 from cryptopus.events import EventBus
 from cryptopus.logger import Logger
 from cryptopus.rate_limiter import RateLimiter
 from cryptopus.websocket_feed import WebSocketPriceFeed
 
+_TICKER_TTL_SECONDS = 2.0
+# The option menus expose 5 symbols x 5 timeframes; 16 entries covers active
+# use while keeping stale 800-candle fetches from accumulating all session.
+_OHLCV_CACHE_MAX_ENTRIES = 16
+
 
 class DataEngine:
     def __init__(self, config: AppConfig, logger: Logger, keys: Dict[str, Dict[str, str]],
@@ -34,8 +39,22 @@ class DataEngine:
         self.exchange = None
         self.latest_price: Dict[str, float] = {}
         self._ws_thread: Optional[WebSocketPriceFeed] = None
-        self._ohlcv_cache: Dict[Tuple[str, str], Tuple[float, List[List[float]]]] = {}
-        self._rate_limiter = RateLimiter(max_calls=10, period_seconds=60.0)
+        # LRU of (fetch time, ccxt rows, lazily converted (N, 6) float64
+        # array), most recently used last.
+        self._ohlcv_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, List[List[float]], Optional[np.ndarray]]]" = OrderedDict()
+        self._ticker_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._cache_lock = threading.Lock()
+        # Coinbase/Kraken public endpoints allow ~10 req/s; our limiter is
+        # the only throttle now that ccxt's internal sleep is disabled.
+        self._rate_limiter = RateLimiter(max_calls=10, period_seconds=1.0)
+        # CoinGecko free tier allows ~30 calls/min; reuse one session so
+        # repeated fallback fetches keep the TCP+TLS connection alive.
+        self._cg_limiter = RateLimiter(max_calls=30, period_seconds=60.0)
+        self._http = None
+        if requests is not None:
+            self._http = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            self._http.mount("https://", adapter)
 
         if ccxt is not None:
             self.exchange = self._init_exchange()
@@ -52,9 +71,21 @@ class DataEngine:
             "apiKey": creds.get("apiKey", ""),
             "secret": creds.get("secret", ""),
             "password": creds.get("password", ""),
-            "enableRateLimit": True,
+            # We throttle via self._rate_limiter; ccxt's limiter would add a
+            # blocking sleep in front of every request on top of it.
+            "enableRateLimit": False,
         })
 
+    def _exc_detail(self, exc: Exception) -> str:
+        """Exception text for log lines; full tracebacks only when asked.
+
+        format_exc() walks and formats the whole stack, which is wasted work
+        on every failing poll while offline or rate limited.
+        """
+        if self.config.debug_tracebacks:
+            return f"{exc}\n{traceback.format_exc()}"
+        return f"{type(exc).__name__}: {exc}"
+
     def set_exchange(self, name: str) -> None:
         self.config.exchange = name
         if ccxt is not None:
@@ -64,63 +95,122 @@ class DataEngine:
     def fetch_ticker(self, symbol: str) -> Optional[Dict]:
         if symbol in self.latest_price:
             return {"last": self.latest_price[symbol], "symbol": symbol, "source": "websocket"}
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._ticker_cache.get(symbol)
+            if cached is not None and now - cached[0] < _TICKER_TTL_SECONDS:
+                return cached[1]
         if not self._rate_limiter.acquire():
             self.logger.log("Rate limited: skipping ticker fetch.")
             return None
+        ticker = None
         if self.exchange is not None:
             try:
-                return self.exchange.fetch_ticker(symbol)
+                ticker = self.exchange.fetch_ticker(symbol)
             except Exception as exc:
-                self.logger.log(f"Ticker fetch failed: {exc}\n{traceback.format_exc()}")
-        return self._fetch_public_price(symbol)
+                self.logger.log(f"Ticker fetch failed: {self._exc_detail(exc)}")
+        if ticker is None:
+            ticker = self._fetch_public_price(symbol)
+        if ticker is not None:
+            with self._cache_lock:
+                self._ticker_cache[symbol] = (time.monotonic(), ticker)
+        return ticker
 
     def _fetch_public_price(self, symbol: str) -> Optional[Dict]:
-        if requests is None:
+        if self._http is None:
+            return None
+        if not self._cg_limiter.acquire():
+            self.logger.log("Rate limited: skipping CoinGecko fetch.")
             return None
         base = symbol.split("/")[0].lower()
+        key = COINGECKO_IDS.get(base)
+        if not key:
+            return None
         try:
-            resp = requests.get(
+            resp = self._http.get(
                 "https://api.coingecko.com/api/v3/simple/price",
-                params={"ids": "bitcoin,ethereum,solana,cardano,avalanche-2", "vs_currencies": "usd"},
+                params={"ids": key, "vs_currencies": "usd"},
                 timeout=5,
             )
             resp.raise_for_status()
             data = resp.json()
-            mapping = {
-                "btc": "bitcoin",
-                "eth": "ethereum",
-                "sol": "solana",
-                "ada": "cardano",
-                "avax": "avalanche-2",
-            }
-            key = mapping.get(base)
-            if not key or key not in data:
+            if key not in data:
                 return None
             price = float(data[key]["usd"])
             return {"last": price, "symbol": symbol}
         except Exception as exc:
-            self.logger.log(f"Public price fetch failed: {exc}\n{traceback.format_exc()}")
+            self.logger.log(f"Public price fetch failed: {self._exc_detail(exc)}")
             return None
 
     def fetch_ohlcv(self, symbol: str, timeframe: str, limit: int = 100) -> Optional[List[List[float]]]:
         if self.exchange is None:
             return None
-        cache_key = (symbol, timeframe)
-        cached = self._ohlcv_cache.get(cache_key)
+        cache_key = (symbol, timeframe, limit)
+        # The open candle moves continuously within its period and the
+        # runner checks stop-loss/take-profit against it, so the cache can
+        # only be trusted for one poll interval; the since= splice below
+        # keeps the refresh itself cheap.
+        ttl = self.config.poll_seconds
+        with self._cache_lock:
+            cached = self._ohlcv_cache.get(cache_key)
+            if cached is not None:
+                self._ohlcv_cache.move_to_end(cache_key)
         if cached is not None:
-            ts, data = cached
-            if time.time() - ts < self.config.poll_seconds:
+            ts, data, _ = cached
+            if time.monotonic() - ts < ttl:
                 return data
         if not self._rate_limiter.acquire():
             self.logger.log("Rate limited: skipping OHLCV fetch.")
             return cached[1] if cached else None
         try:
-            data = self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
-            self._ohlcv_cache[cache_key] = (time.time(), data)
+            if cached is not None and cached[1]:
+                # Closed candles cannot change, so refresh only from the last
+                # cached bar onward and splice the tail in place.
+                data = cached[1]
+                fresh = self.exchange.fetch_ohlcv(
+                    symbol, timeframe=timeframe, since=int(data[-1][0]), limit=limit,
+                )
+                if fresh:
+                    if fresh[0][0] == data[-1][0]:
+                        data[-1] = fresh[0]
+                        fresh = fresh[1:]
+                    data.extend(fresh)
+                    if len(data) > limit:
+                        del data[:len(data) - limit]
+            else:
+                data = self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
+            with self._cache_lock:
+                self._ohlcv_cache[cache_key] = (time.monotonic(), data, None)
+                self._ohlcv_cache.move_to_end(cache_key)
+                while len(self._ohlcv_cache) > _OHLCV_CACHE_MAX_ENTRIES:
+                    self._ohlcv_cache.popitem(last=False)
             return data
         except Exception as exc:
-            self.logger.log(f"OHLCV fetch failed: {exc}\n{traceback.format_exc()}")
+            self.logger.log(f"OHLCV fetch failed: {self._exc_detail(exc)}")
+            return None
+
+    def fetch_ohlcv_array(self, symbol: str, timeframe: str, limit: int = 100) -> Optional[np.ndarray]:
+        """OHLCV as an (N, 6) float64 array, converted once per cache entry.
+
+        Backtests consume arrays, so caching the conversion means a
+        five-strategy comparison parses the ccxt rows once; the stable array
+        identity also lets the backtest engine reuse its indicator cache
+        across runs over the same candles.
+        """
+        data = self.fetch_ohlcv(symbol, timeframe, limit=limit)
+        if not data:
             return None
+        cache_key = (symbol, timeframe, limit)
+        with self._cache_lock:
+            cached = self._ohlcv_cache.get(cache_key)
+            if cached is not None and cached[1] is data and cached[2] is not None:
+                return cached[2]
+        arr = np.asarray(data, dtype=np.float64)
+        with self._cache_lock:
+            cached = self._ohlcv_cache.get(cache_key)
+            if cached is not None and cached[1] is data:
+                self._ohlcv_cache[cache_key] = (cached[0], data, arr)
+        return arr
 
     def _start_ws_if_needed(self) -> None:
         if self._ws_thread:
@@ -130,13 +220,16 @@ class DataEngine:
             return
         if self.config.exchange != "coinbase":
             return
-        if _ws_module is None:
+        # find_spec checks availability without executing the module; the
+        # real import happens inside the feed thread.
+        if importlib.util.find_spec("websocket") is None:
             self.logger.log("websocket-client not installed; websocket feed disabled.")
             return
         self._ws_thread = WebSocketPriceFeed(
             symbol=self.config.symbol,
             logger=self.logger,
             on_price=self._update_price,
+            ping_interval=self.config.ws_ping_interval,
         )
         self._ws_thread.start()
 
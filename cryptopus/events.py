@@ -1,23 +1,37 @@
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict
 
 
 class EventBus:
     """Simple callback-based event system."""
 
     def __init__(self) -> None:
-        self._listeners: Dict[str, List[Callable[..., Any]]] = {}
+        # A dict used as an ordered set, keyed by the callback itself:
+        # off() is O(1) instead of a list scan, emit order follows
+        # registration order, and bound methods compare by value so
+        # bus.off("e", obj.handler) finds the entry bus.on registered.
+        self._listeners: Dict[str, Dict[Callable[..., Any], None]] = {}
 
     def on(self, event: str, callback: Callable[..., Any]) -> None:
         """Register a callback for an event."""
-        self._listeners.setdefault(event, []).append(callback)
+        self._listeners.setdefault(event, {})[callback] = None
 
     def off(self, event: str, callback: Callable[..., Any]) -> None:
         """Remove a callback for an event."""
-        listeners = self._listeners.get(event, [])
-        if callback in listeners:
-            listeners.remove(callback)
+        self._listeners.get(event, {}).pop(callback, None)
 
     def emit(self, event: str, *args: Any, **kwargs: Any) -> None:
-        """Emit an event, calling all registered callbacks."""
-        for cb in self._listeners.get(event, []):
+        """Emit an event, calling all registered callbacks.
+
+        Iterates over a snapshot so callbacks may unsubscribe themselves.
+        """
+        listeners = self._listeners.get(event)
+        if not listeners:
+            return
+        if len(listeners) == 1:
+            # Dominant shape: a single subscriber. Call it directly and
+            # skip the snapshot copy; the callback is already bound, so
+            # self-unsubscription stays safe.
+            next(iter(listeners))(*args, **kwargs)
+            return
+        for cb in list(listeners):
             cb(*args, **kwargs)
@@ -1,11 +1,20 @@
-import queue
-from datetime import datetime, timezone
+import time
+from collections import deque
 
 
 class Logger:
-    def __init__(self, log_queue: queue.Queue) -> None:
-        self.log_queue = log_queue
+    def __init__(self, log_buffer: deque) -> None:
+        # deque.append is atomic under the GIL, so producers on background
+        # threads never take a lock; maxlen bounds memory if the UI lags.
+        self.log_buffer = log_buffer
+        self._ts_sec = 0
+        self._ts_str = ""
 
     def log(self, msg: str) -> None:
-        ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-        self.log_queue.put(f"[{ts}] {msg}")
+        # Timestamps have 1 s resolution, so re-format only when the second
+        # changes instead of paying for strftime on every line.
+        sec = int(time.time())
+        if sec != self._ts_sec:
+            self._ts_str = time.strftime("%Y-%m-%d %H:%M:%S UTC", time.gmtime(sec))
+            self._ts_sec = sec
+        self.log_buffer.append(f"[{self._ts_str}] {msg}")
@@ -1,7 +1,12 @@
+import atexit
+import queue
 import sqlite3
 import threading
+import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional
 
 from cryptopus.config import Order, Position
 
@@ -9,8 +14,43 @@ from cryptopus.config import Order, Position
 class TradeStore:
     def __init__(self, db_path: str = "cryptopus.db") -> None:
         self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        # WAL lets reads proceed alongside the writer and NORMAL drops the
+        # fsync-per-commit of the default rollback journal; both settings
+        # stick to the database file. The rest keep hot pages and temp
+        # structures in memory.
+        cur = self._conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA cache_size=-64000")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA mmap_size=268435456")
         self._lock = threading.Lock()
         self._create_tables()
+        # One long-lived writer cursor: the sqlite3 statement cache already
+        # skips re-parsing repeated SQL, this just drops the per-call cursor
+        # allocation on the write path.
+        self._write_cur = self._conn.cursor()
+        # With WAL on, reads can run concurrently with the writer; a small
+        # pool of read-only connections keeps UI refreshes from queueing on
+        # the writer lock. In-memory databases are private to their
+        # connection, so those fall back to reading through the writer.
+        self._readers: Optional[queue.Queue] = None
+        if db_path != ":memory:":
+            self._readers = queue.Queue()
+            for _ in range(4):
+                self._readers.put(sqlite3.connect(
+                    f"file:{db_path}?mode=ro", uri=True, check_same_thread=False,
+                ))
+        # Order inserts are buffered and written as one transaction by a
+        # background thread, so a burst of fills costs one commit instead of
+        # one fsync each. The loss window is bounded by _flush_interval.
+        self._pending_orders: deque = deque()
+        self._pending_cv = threading.Condition()
+        self._max_buffer = 100
+        self._flush_interval = 0.01
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush)
 
     def _create_tables(self) -> None:
         with self._lock:
@@ -43,55 +83,149 @@ class TradeStore:
             """)
             self._conn.commit()
 
-    def save_order(self, order: Order) -> None:
+    @contextmanager
+    def _read(self):
+        if self._readers is None:
+            with self._lock:
+                yield self._conn
+            return
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def save_order(self, order: Order, durable: bool = False) -> None:
+        """Queue an order for the next batched write.
+
+        ``durable=True`` flushes immediately for records that must survive a
+        crash (e.g. live fills); the default rides the write buffer.
+        """
+        params = (order.ts.isoformat(), order.symbol, order.side, order.price,
+                  order.amount, order.status, order.exchange_id)
+        with self._pending_cv:
+            self._pending_orders.append(params)
+            need_flush = durable or len(self._pending_orders) >= self._max_buffer
+            self._pending_cv.notify()
+        if need_flush:
+            self.flush()
+
+    def save_orders(self, orders) -> None:
+        """Write a batch of orders in one transaction.
+
+        Replaying many fills (e.g. importing a session) through
+        save_order would pay the flush machinery per record; this queues
+        them all and commits once.
+        """
+        params = [
+            (o.ts.isoformat(), o.symbol, o.side, o.price, o.amount, o.status, o.exchange_id)
+            for o in orders
+        ]
+        if not params:
+            return
+        with self._pending_cv:
+            self._pending_orders.extend(params)
+        self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered orders in one transaction."""
+        with self._pending_cv:
+            if not self._pending_orders:
+                return
+            batch = list(self._pending_orders)
+            self._pending_orders.clear()
         with self._lock:
-            self._conn.execute(
+            self._write_cur.executemany(
                 "INSERT INTO orders (ts, symbol, side, price, amount, status, exchange_id) VALUES (?,?,?,?,?,?,?)",
-                (order.ts.isoformat(), order.symbol, order.side, order.price, order.amount, order.status, order.exchange_id),
+                batch,
             )
             self._conn.commit()
 
-    def load_orders(self, limit: int = 200) -> List[Order]:
+    def _flush_loop(self) -> None:
+        while True:
+            with self._pending_cv:
+                while not self._pending_orders:
+                    self._pending_cv.wait()
+            # Let the rest of a burst arrive before paying for the commit.
+            time.sleep(self._flush_interval)
+            self.flush()
+
+    def save_fill(self, order: Order, pos: Position, date_str: str, pnl: float) -> None:
+        """Persist a fill — order, position and daily P&L — in one commit.
+
+        One fsync covers all three writes instead of three separate
+        committing calls per trade.
+        """
+        self.flush()  # preserve insert order relative to buffered rows
         with self._lock:
-            rows = self._conn.execute(
-                "SELECT ts, symbol, side, price, amount, status, exchange_id FROM orders ORDER BY id DESC LIMIT ?",
-                (limit,),
-            ).fetchall()
-        result = []
-        for row in reversed(rows):
-            result.append(Order(
-                ts=datetime.fromisoformat(row[0]),
-                symbol=row[1],
-                side=row[2],
-                price=row[3],
-                amount=row[4],
-                status=row[5],
-                exchange_id=row[6],
-            ))
-        return result
+            self._write_cur.execute(
+                "INSERT INTO orders (ts, symbol, side, price, amount, status, exchange_id) VALUES (?,?,?,?,?,?,?)",
+                (order.ts.isoformat(), order.symbol, order.side, order.price,
+                 order.amount, order.status, order.exchange_id),
+            )
+            self._write_cur.execute(
+                "INSERT OR REPLACE INTO positions (symbol, amount, avg_price, realized_pnl) VALUES (?,?,?,?)",
+                (pos.symbol, pos.amount, pos.avg_price, pos.realized_pnl),
+            )
+            self._write_cur.execute(
+                "INSERT OR REPLACE INTO daily_pnl (date, pnl) VALUES (?,?)",
+                (date_str, pnl),
+            )
+            self._conn.commit()
+
+    def iter_orders(self, limit: Optional[int] = None) -> Iterator[Order]:
+        """Yield the newest ``limit`` orders oldest-first, streaming rows.
+
+        Rows come straight off the cursor and Order instances are built
+        lazily, so large histories never sit in memory twice. The reader
+        connection is held for the life of the generator.
+        """
+        self.flush()
+        with self._read() as conn:
+            # Take the newest rows but hand them back oldest-first straight
+            # from SQLite, instead of reversing in Python. LIMIT -1 means
+            # no limit.
+            cur = conn.execute(
+                "SELECT ts, symbol, side, price, amount, status, exchange_id FROM "
+                "(SELECT * FROM orders ORDER BY id DESC LIMIT ?) ORDER BY id ASC",
+                (-1 if limit is None else limit,),
+            )
+            for row in cur:
+                yield Order(
+                    ts=datetime.fromisoformat(row[0]),
+                    symbol=row[1],
+                    side=row[2],
+                    price=row[3],
+                    amount=row[4],
+                    status=row[5],
+                    exchange_id=row[6],
+                )
+
+    def load_orders(self, limit: int = 200) -> List[Order]:
+        return list(self.iter_orders(limit))
 
     def save_position(self, pos: Position) -> None:
         with self._lock:
-            self._conn.execute(
+            self._write_cur.execute(
                 "INSERT OR REPLACE INTO positions (symbol, amount, avg_price, realized_pnl) VALUES (?,?,?,?)",
                 (pos.symbol, pos.amount, pos.avg_price, pos.realized_pnl),
             )
             self._conn.commit()
 
     def load_positions(self) -> Dict[str, Position]:
-        with self._lock:
-            rows = self._conn.execute("SELECT symbol, amount, avg_price, realized_pnl FROM positions").fetchall()
+        with self._read() as conn:
+            rows = conn.execute("SELECT symbol, amount, avg_price, realized_pnl FROM positions").fetchall()
         return {r[0]: Position(symbol=r[0], amount=r[1], avg_price=r[2], realized_pnl=r[3]) for r in rows}
 
     def save_daily_pnl(self, date_str: str, pnl: float) -> None:
         with self._lock:
-            self._conn.execute(
+            self._write_cur.execute(
                 "INSERT OR REPLACE INTO daily_pnl (date, pnl) VALUES (?,?)",
                 (date_str, pnl),
             )
             self._conn.commit()
 
     def load_daily_pnl(self, date_str: str) -> float:
-        with self._lock:
-            row = self._conn.execute("SELECT pnl FROM daily_pnl WHERE date=?", (date_str,)).fetchone()
+        with self._read() as conn:
+            row = conn.execute("SELECT pnl FROM daily_pnl WHERE date=?", (date_str,)).fetchone()
         return row[0] if row else 0.0
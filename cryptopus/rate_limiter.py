@@ -1,20 +1,29 @@
 import threading
 import time
-from typing import List
 
 
 class RateLimiter:
+    """Token bucket allowing ``max_calls`` per ``period_seconds``.
+
+    Two floats of state and no per-call bookkeeping: tokens refill
+    continuously at max_calls/period and each admission spends one.
+    """
+
     def __init__(self, max_calls: int = 10, period_seconds: float = 60.0) -> None:
         self._max_calls = max_calls
-        self._period = period_seconds
-        self._timestamps: List[float] = []
+        self._refill_rate = max_calls / period_seconds
+        self._tokens = float(max_calls)
+        # monotonic is immune to NTP/wall-clock jumps.
+        self._last = time.monotonic()
         self._lock = threading.Lock()
 
     def acquire(self) -> bool:
-        now = time.time()
+        now = time.monotonic()
         with self._lock:
-            self._timestamps = [t for t in self._timestamps if now - t < self._period]
-            if len(self._timestamps) >= self._max_calls:
-                return False
-            self._timestamps.append(now)
-            return True
+            self._tokens = min(float(self._max_calls),
+                               self._tokens + (now - self._last) * self._refill_rate)
+            self._last = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
@@ -47,10 +47,16 @@ class StrategyRunner(threading.Thread):
         return size
 
     def _tick(self) -> None:
-        ohlcv = self.data_engine.fetch_ohlcv(self.config.symbol, self.config.timeframe, limit=120)
-        if not ohlcv:
+        # Bind the per-tick config reads once; the loop runs forever and
+        # these do not change mid-tick.
+        cfg = self.config
+        symbol = cfg.symbol
+        # The array form gives the strategies contiguous columns to slice;
+        # the conversion is cached per fetch in the data engine.
+        ohlcv = self.data_engine.fetch_ohlcv_array(symbol, cfg.timeframe, limit=120)
+        if ohlcv is None or len(ohlcv) == 0:
             return
-        last_price = ohlcv[-1][4]
+        last_price = float(ohlcv[-1, 4])
 
         # Check SL/TP on open positions
         self._check_sl_tp(last_price)
@@ -60,22 +66,39 @@ class StrategyRunner(threading.Thread):
         signal = self.strategy.evaluate(ohlcv)
         if signal in ("buy", "sell"):
             if signal == "sell":
-                pos = self.trader.positions.get(self.config.symbol)
+                pos = self.trader.positions.get(symbol)
                 if not pos or pos.amount <= 0:
                     return
                 amount = pos.amount
             else:
                 amount = self._calculate_position_size(ohlcv, last_price)
-            self.trader.place_order(self.config.symbol, signal, amount, last_price)
+            self.trader.place_order(symbol, signal, amount, last_price)
             self.logger.log(f"{self.strategy.name} signal: {signal} @ {last_price:.2f} (size: {amount:.6f})")
             self._last_trade_ts = time.time()
             if self.events:
                 self.events.emit("strategy_signal", self.strategy.name, signal, last_price)
 
     def _check_sl_tp(self, current_price: float) -> None:
-        pos = self.trader.positions.get(self.config.symbol)
-        if not pos or pos.amount <= 0 or pos.avg_price <= 0:
-            return
+        """Check stop loss / take profit on every open position.
+
+        The active symbol uses the freshly fetched close; other positions
+        (e.g. loaded from the DB after a symbol switch) are checked against
+        the websocket price cache so no extra REST calls are made per poll.
+        """
+        active_symbol = self.config.symbol
+        latest_price = self.data_engine.latest_price
+        for symbol, pos in list(self.trader.positions.items()):
+            if pos.amount <= 0 or pos.avg_price <= 0:
+                continue
+            if symbol == active_symbol:
+                price = current_price
+            else:
+                price = latest_price.get(symbol)
+                if price is None:
+                    continue
+            self._check_position_sl_tp(symbol, pos, price)
+
+    def _check_position_sl_tp(self, symbol: str, pos, current_price: float) -> None:
         sl_pct = self.config.stop_loss_pct
         tp_pct = self.config.take_profit_pct
         if sl_pct > 0:
@@ -85,7 +108,7 @@ class StrategyRunner(threading.Thread):
                     f"STOP LOSS triggered: price {current_price:.2f} <= SL {sl_price:.2f} "
                     f"(entry {pos.avg_price:.2f}, -{sl_pct}%)"
                 )
-                self.trader.place_order(self.config.symbol, "sell", pos.amount, current_price)
+                self.trader.place_order(symbol, "sell", pos.amount, current_price)
                 self._last_trade_ts = time.time()
                 return
         if tp_pct > 0:
@@ -95,7 +118,7 @@ class StrategyRunner(threading.Thread):
                     f"TAKE PROFIT triggered: price {current_price:.2f} >= TP {tp_price:.2f} "
                     f"(entry {pos.avg_price:.2f}, +{tp_pct}%)"
                 )
-                self.trader.place_order(self.config.symbol, "sell", pos.amount, current_price)
+                self.trader.place_order(symbol, "sell", pos.amount, current_price)
                 self._last_trade_ts = time.time()
 
     def _risk_blocked(self) -> bool:
@@ -1,5 +1,7 @@
 from typing import List, Optional
 
+import numpy as np
+
 from cryptopus.strategies.momentum import MomentumStrategy
 from cryptopus.strategies.mean_reversion import MeanReversionStrategy
 from cryptopus.strategies.breakout import BreakoutStrategy
@@ -9,22 +11,36 @@ from cryptopus.strategies.contra_momentum import ContraMomentumStrategy
 
 class StrategyBase:
     name = "Base"
+    # Bars of history evaluate() needs; 0 means unbounded. Strategies that
+    # declare a bound let the backtest fallback trim its rolling window.
+    lookback = 0
 
     def evaluate(self, ohlcv: List[List[float]]) -> Optional[str]:
         raise NotImplementedError
 
 
+# Single-entry memo for compute_atr; the key includes the last bar's
+# timestamp because the data engine splices new candles into the cached
+# list in place, so object identity alone is not enough.
+_atr_cache: dict = {}
+
+
 def compute_atr(ohlcv: List[List[float]], period: int = 14) -> float:
     if len(ohlcv) < period + 1:
         return 0.0
-    true_ranges = []
-    for i in range(1, len(ohlcv)):
-        high = ohlcv[i][2]
-        low = ohlcv[i][3]
-        prev_close = ohlcv[i - 1][4]
-        tr = max(high - low, abs(high - prev_close), abs(low - prev_close))
-        true_ranges.append(tr)
-    return sum(true_ranges[-period:]) / period
+    key = (id(ohlcv), len(ohlcv), ohlcv[-1][0], period)
+    if _atr_cache.get("key") == key:
+        return _atr_cache["value"]
+    arr = np.asarray(ohlcv, dtype=np.float64)
+    highs = arr[1:, 2]
+    lows = arr[1:, 3]
+    prev_closes = arr[:-1, 4]
+    true_ranges = np.maximum(np.maximum(highs - lows, np.abs(highs - prev_closes)),
+                             np.abs(lows - prev_closes))
+    value = float(true_ranges[-period:].mean())
+    _atr_cache["key"] = key
+    _atr_cache["value"] = value
+    return value
 
 
 STRATEGIES = [
@@ -1,5 +1,7 @@
 from typing import List, Optional
 
+import numpy as np
+
 
 class BreakoutStrategy:
     name = "Breakout"
@@ -7,6 +9,8 @@ class BreakoutStrategy:
     def __init__(self, buffer_pct: float = 0.1, window: int = 20) -> None:
         self.buffer_pct = buffer_pct
         self.window = window
+        self._up_buffer = 1 + buffer_pct / 100
+        self._down_buffer = 1 - buffer_pct / 100
 
     @property
     def description(self) -> str:
@@ -17,15 +21,12 @@ class BreakoutStrategy:
         )
 
     def evaluate(self, ohlcv: List[List[float]]) -> Optional[str]:
-        highs = [c[2] for c in ohlcv][-self.window:]
-        lows = [c[3] for c in ohlcv][-self.window:]
-        if len(highs) < self.window:
+        if len(ohlcv) < self.window:
             return None
-        last_close = ohlcv[-1][4]
-        up_buffer = 1 + self.buffer_pct / 100
-        down_buffer = 1 - self.buffer_pct / 100
-        if last_close > max(highs[:-1]) * up_buffer:
+        arr = ohlcv if isinstance(ohlcv, np.ndarray) else np.asarray(ohlcv, dtype=np.float64)
+        last_close = arr[-1, 4]
+        if last_close > arr[-self.window:-1, 2].max() * self._up_buffer:
             return "buy"
-        if last_close < min(lows[:-1]) * down_buffer:
+        if last_close < arr[-self.window:-1, 3].min() * self._down_buffer:
             return "sell"
         return None
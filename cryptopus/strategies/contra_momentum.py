@@ -6,6 +6,8 @@ class ContraMomentumStrategy:
 
     def __init__(self, threshold_pct: float = 0.3) -> None:
         self.threshold_pct = threshold_pct
+        self._up = 1 + threshold_pct / 100
+        self._down = 1 - threshold_pct / 100
 
     @property
     def description(self) -> str:
@@ -20,10 +22,8 @@ class ContraMomentumStrategy:
             return None
         last = ohlcv[-1][4]
         prev = ohlcv[-2][4]
-        up = 1 + self.threshold_pct / 100
-        down = 1 - self.threshold_pct / 100
-        if last > prev * up:
+        if last > prev * self._up:
             return "sell"
-        if last < prev * down:
+        if last < prev * self._down:
             return "buy"
         return None
@@ -1,5 +1,7 @@
 from typing import List, Optional
 
+import numpy as np
+
 
 class MeanReversionStrategy:
     name = "Mean Reversion"
@@ -7,6 +9,8 @@ class MeanReversionStrategy:
     def __init__(self, threshold_pct: float = 1.0, window: int = 20) -> None:
         self.threshold_pct = threshold_pct
         self.window = window
+        self._buy_thresh = 1 - threshold_pct / 100
+        self._sell_thresh = 1 + threshold_pct / 100
 
     @property
     def description(self) -> str:
@@ -17,15 +21,17 @@ class MeanReversionStrategy:
         )
 
     def evaluate(self, ohlcv: List[List[float]]) -> Optional[str]:
-        closes = [c[4] for c in ohlcv][-self.window:]
-        if len(closes) < self.window:
+        if len(ohlcv) < self.window:
             return None
-        mean = sum(closes) / len(closes)
+        # The data engine hands out contiguous (N, 6) arrays; the close
+        # column is then one strided slice instead of a row-by-row walk.
+        # List input (tests, ad-hoc callers) converts once.
+        arr = ohlcv if isinstance(ohlcv, np.ndarray) else np.asarray(ohlcv, dtype=np.float64)
+        closes = arr[-self.window:, 4]
+        mean = closes.mean()
         last = closes[-1]
-        buy_thresh = 1 - self.threshold_pct / 100
-        sell_thresh = 1 + self.threshold_pct / 100
-        if last < mean * buy_thresh:
+        if last < mean * self._buy_thresh:
             return "buy"
-        if last > mean * sell_thresh:
+        if last > mean * self._sell_thresh:
             return "sell"
         return None
@@ -7,6 +7,10 @@ class MomentumStrategy:
     def __init__(self, threshold_pct: float = 0.2, window: int = 5) -> None:
         self.threshold_pct = threshold_pct
         self.window = window
+        # Threshold is fixed at construction; precompute the multipliers so
+        # the per-tick evaluate is just two compares.
+        self._up = 1 + threshold_pct / 100
+        self._down = 1 - threshold_pct / 100
 
     @property
     def description(self) -> str:
@@ -17,13 +21,14 @@ class MomentumStrategy:
         )
 
     def evaluate(self, ohlcv: List[List[float]]) -> Optional[str]:
-        closes = [c[4] for c in ohlcv][-self.window:]
-        if len(closes) < self.window:
+        if len(ohlcv) < self.window:
             return None
-        up = 1 + self.threshold_pct / 100
-        down = 1 - self.threshold_pct / 100
-        if closes[-1] > closes[0] * up:
+        # Row-then-column indexing works for both list-of-lists and the
+        # (N, 6) float64 arrays the data engine hands out.
+        first = ohlcv[-self.window][4]
+        last = ohlcv[-1][4]
+        if last > first * self._up:
             return "buy"
-        if closes[-1] < closes[0] * down:
+        if last < first * self._down:
             return "sell"
         return None
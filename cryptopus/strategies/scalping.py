@@ -1,5 +1,7 @@
 from typing import List, Optional
 
+import numpy as np
+
 
 class ScalpingStrategy:
     name = "Scalping"
@@ -7,6 +9,7 @@ class ScalpingStrategy:
     def __init__(self, band_pct: float = 10.0, window: int = 10) -> None:
         self.band_pct = band_pct
         self.window = window
+        self._band = band_pct / 100
 
     @property
     def description(self) -> str:
@@ -17,16 +20,19 @@ class ScalpingStrategy:
         )
 
     def evaluate(self, ohlcv: List[List[float]]) -> Optional[str]:
-        closes = [c[4] for c in ohlcv][-self.window:]
-        if len(closes) < self.window:
+        if len(ohlcv) < self.window:
             return None
-        spread = max(closes) - min(closes)
+        arr = ohlcv if isinstance(ohlcv, np.ndarray) else np.asarray(ohlcv, dtype=np.float64)
+        closes = arr[-self.window:, 4]
+        lo = closes.min()
+        hi = closes.max()
+        spread = hi - lo
         if spread == 0:
             return None
         last = closes[-1]
-        band = self.band_pct / 100
-        if last <= min(closes) + spread * band:
+        band = self._band
+        if last <= lo + spread * band:
             return "buy"
-        if last >= max(closes) - spread * band:
+        if last >= hi - spread * band:
             return "sell"
         return None
@@ -1,7 +1,8 @@
 import threading
 import traceback
+from collections import deque
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
 from cryptopus.config import AppConfig, Order, Position
 from cryptopus.data_engine import DataEngine
@@ -19,23 +20,30 @@ class Trader:
         self.store = store
         self.events = events
         self.positions: Dict[str, Position] = {}
-        self.orders: List[Order] = []
+        # Bounded history plus a small window the UI renders directly, so a
+        # long session neither grows without limit nor slices per refresh.
+        self.orders: deque = deque(maxlen=2000)
+        self.recent_orders: deque = deque(maxlen=50)
         self.realized_pnl_today: float = 0.0
-        self._pnl_day: Optional[int] = None
+        # Day number and date string are cached until the UTC day rolls so
+        # per-fill P&L updates skip the strftime/tuple machinery.
+        now = datetime.now(timezone.utc)
+        self._pnl_day: int = now.toordinal()
+        self._today_str: str = now.strftime("%Y-%m-%d")
         self._pnl_lock = threading.Lock()
 
         if self.store:
             self.positions = self.store.load_positions()
-            self.orders = self.store.load_orders(limit=200)
-            today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-            self.realized_pnl_today = self.store.load_daily_pnl(today)
-            self._pnl_day = datetime.now(timezone.utc).timetuple().tm_yday
+            self.orders.extend(self.store.load_orders(limit=200))
+            self.recent_orders.extend(self.orders)
+            self.realized_pnl_today = self.store.load_daily_pnl(self._today_str)
             if self.positions:
                 self.logger.log(f"Loaded {len(self.positions)} positions from DB.")
             if self.orders:
                 self.logger.log(f"Loaded {len(self.orders)} orders from DB.")
 
     def place_order(self, symbol: str, side: str, amount: float, price: float) -> Order:
+        now = datetime.now(timezone.utc)
         if self.config.live_trading and self.data_engine.exchange is not None:
             try:
                 order = self.data_engine.exchange.create_order(
@@ -45,7 +53,7 @@ class Trader:
                     amount=amount,
                 )
                 record = Order(
-                    ts=datetime.now(timezone.utc),
+                    ts=now,
                     side=side,
                     price=price,
                     amount=amount,
@@ -54,49 +62,54 @@ class Trader:
                     exchange_id=order.get("id"),
                 )
                 self.logger.log(f"Live order submitted: {side} {amount} {symbol}")
-                self._apply_fill(symbol, side, amount, price)
-                self.orders.append(record)
-                if self.store:
-                    self.store.save_order(record)
-                if self.events:
-                    self.events.emit("order_placed", record)
+                pos = self._apply_fill(symbol, side, amount, price)
+                self._record_order(record, pos)
                 return record
             except Exception as exc:
                 self.logger.log(f"Live order FAILED: {exc}\n{traceback.format_exc()}")
                 record = Order(
-                    ts=datetime.now(timezone.utc),
+                    ts=now,
                     side=side,
                     price=price,
                     amount=amount,
                     status="failed",
                     symbol=symbol,
                 )
-                self.orders.append(record)
-                if self.store:
-                    self.store.save_order(record)
-                if self.events:
-                    self.events.emit("order_placed", record)
+                self._record_order(record)
                 return record
 
         record = Order(
-            ts=datetime.now(timezone.utc),
+            ts=now,
             side=side,
             price=price,
             amount=amount,
             status="paper",
             symbol=symbol,
         )
-        self._apply_fill(symbol, side, amount, price)
+        pos = self._apply_fill(symbol, side, amount, price)
+        self._record_order(record, pos)
+        self.logger.log(f"Paper order: {side} {amount} {symbol} @ {price:.2f}")
+        return record
+
+    def _record_order(self, record: Order, pos: Optional[Position] = None) -> None:
         self.orders.append(record)
+        self.recent_orders.append(record)
         if self.store:
-            self.store.save_order(record)
+            if pos is not None:
+                # One transaction covers the order, position and daily P&L.
+                with self._pnl_lock:
+                    today = self._today_str
+                    pnl = self.realized_pnl_today
+                self.store.save_fill(record, pos, today, pnl)
+            else:
+                self.store.save_order(record)
         if self.events:
             self.events.emit("order_placed", record)
-        self.logger.log(f"Paper order: {side} {amount} {symbol} @ {price:.2f}")
-        return record
 
-    def _apply_fill(self, symbol: str, side: str, amount: float, price: float) -> None:
-        pos = self.positions.get(symbol, Position(symbol=symbol))
+    def _apply_fill(self, symbol: str, side: str, amount: float, price: float) -> Position:
+        pos = self.positions.get(symbol)
+        if pos is None:
+            pos = self.positions[symbol] = Position(symbol=symbol)
         if side == "buy":
             new_amount = pos.amount + amount
             if new_amount > 0:
@@ -116,11 +129,9 @@ class Trader:
             if pos.amount < 1e-12:
                 pos.amount = 0
                 pos.avg_price = 0
-        self.positions[symbol] = pos
-        if self.store:
-            self.store.save_position(pos)
         if self.events:
             self.events.emit("position_updated", pos)
+        return pos
 
     def reconcile_positions(self) -> None:
         """Sync local positions with actual exchange balances.
@@ -176,11 +187,10 @@ class Trader:
 
     def _update_daily_pnl(self, realized: float) -> None:
         with self._pnl_lock:
-            day = datetime.now(timezone.utc).timetuple().tm_yday
+            now = datetime.now(timezone.utc)
+            day = now.toordinal()
             if self._pnl_day != day:
                 self.realized_pnl_today = 0.0
                 self._pnl_day = day
+                self._today_str = now.strftime("%Y-%m-%d")
             self.realized_pnl_today += realized
-            if self.store:
-                today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-                self.store.save_daily_pnl(today, self.realized_pnl_today)
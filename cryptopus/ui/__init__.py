@@ -1,5 +1,5 @@
 import json
-import queue
+from collections import OrderedDict, deque
 from tkinter import ttk, messagebox
 from typing import Dict
 
@@ -42,8 +42,8 @@ class App(_CTK_BASE):  # type: ignore[misc]
         self.title(APP_TITLE)
         self.geometry("1200x780")
 
-        self.log_queue: queue.Queue = queue.Queue()
-        self.logger = Logger(self.log_queue)
+        self.log_buffer: deque = deque(maxlen=10_000)
+        self.logger = Logger(self.log_buffer)
         self.events = EventBus()
 
         self.config_state = AppConfig()
@@ -58,6 +58,15 @@ class App(_CTK_BASE):  # type: ignore[misc]
             "equity": {"canvas": None, "fig": None, "ax": None, "info": None},
             "returns": {"canvas": None, "fig": None, "ax": None, "info": None},
         }
+        # Finished backtests keyed by data fingerprint + run parameters, so
+        # re-running an unchanged setup (e.g. Compare then a single tab) is
+        # instant. LRU, bounded in backtest_tab.
+        self.backtest_cache: "OrderedDict" = OrderedDict()
+        # Row-key -> Treeview item id maps so the polling refreshers update
+        # cells in place instead of destroying and recreating every row.
+        self._market_rows: Dict[str, str] = {}
+        self._position_rows: Dict[str, str] = {}
+        self._order_rows: Dict[int, str] = {}
 
         self._build_ui()
         self._poll_logs()
@@ -159,9 +168,16 @@ class App(_CTK_BASE):  # type: ignore[misc]
         source = ticker.get("source", "rest")
         self.overview_price.configure(text=f"Last Price: {price:.2f} ({symbol}) [{source}]")
 
-        self.market_tree.delete(*self.market_tree.get_children())
+        seen = set()
         for key, value in ticker.items():
-            self.market_tree.insert("", "end", values=(key, value))
+            seen.add(key)
+            iid = self._market_rows.get(key)
+            if iid is None:
+                self._market_rows[key] = self.market_tree.insert("", "end", values=(key, value))
+            else:
+                self.market_tree.set(iid, "value", value)
+        for key in [k for k in self._market_rows if k not in seen]:
+            self.market_tree.delete(self._market_rows.pop(key))
 
     def _select_strategy(self, selection: str) -> None:
         for strat in STRATEGIES:
@@ -208,16 +224,28 @@ class App(_CTK_BASE):  # type: ignore[misc]
                     self.logger.log(f"EMERGENCY: could not get price for {symbol}, position NOT closed.")
 
     def _refresh_positions(self) -> None:
-        self.positions_tree.delete(*self.positions_tree.get_children())
+        seen = set()
         for pos in self.trader.positions.values():
-            self.positions_tree.insert(
-                "", "end",
-                values=(pos.symbol, pos.amount, f"{pos.avg_price:.2f}", f"{pos.realized_pnl:.2f}"),
-            )
-
-        self.orders_tree.delete(*self.orders_tree.get_children())
-        for order in self.trader.orders[-50:]:
-            self.orders_tree.insert(
+            seen.add(pos.symbol)
+            values = (pos.symbol, pos.amount, f"{pos.avg_price:.2f}", f"{pos.realized_pnl:.2f}")
+            iid = self._position_rows.get(pos.symbol)
+            if iid is None:
+                self._position_rows[pos.symbol] = self.positions_tree.insert("", "end", values=values)
+            else:
+                self.positions_tree.item(iid, values=values)
+        for symbol in [s for s in self._position_rows if s not in seen]:
+            self.positions_tree.delete(self._position_rows.pop(symbol))
+
+        # Orders are append-only and immutable once recorded, so only the
+        # rows entering or leaving the recent-orders window need widget work.
+        orders = self.trader.recent_orders
+        live = {id(order) for order in orders}
+        for oid in [i for i in self._order_rows if i not in live]:
+            self.orders_tree.delete(self._order_rows.pop(oid))
+        for order in orders:
+            if id(order) in self._order_rows:
+                continue
+            self._order_rows[id(order)] = self.orders_tree.insert(
                 "", "end",
                 values=(
                     order.ts.strftime("%Y-%m-%d %H:%M:%S"),
@@ -233,8 +261,10 @@ class App(_CTK_BASE):  # type: ignore[misc]
         self.config_state.exchange = self.exchange_var.get()
         self.config_state.symbol = self.symbol_var.get()
         self.config_state.timeframe = self.timeframe_var.get()
+        # Entry fields have no StringVar; read the widget text directly.
+        entries = self._settings_entries
         try:
-            self.config_state.poll_seconds = int(self.poll_var.get())
+            self.config_state.poll_seconds = int(entries["poll"].get())
         except ValueError:
             messagebox.showerror("Invalid Input", "Poll seconds must be an integer.")
             return
@@ -257,10 +287,10 @@ class App(_CTK_BASE):  # type: ignore[misc]
         self.config_state.live_trading = wants_live
         self.config_state.enable_websocket = self.ws_var.get()
         try:
-            self.config_state.max_daily_loss = float(self.max_loss_var.get())
-            self.config_state.cooldown_seconds = int(self.cooldown_var.get())
-            self.config_state.stop_loss_pct = float(self.sl_var.get())
-            self.config_state.take_profit_pct = float(self.tp_var.get())
+            self.config_state.max_daily_loss = float(entries["max_loss"].get())
+            self.config_state.cooldown_seconds = int(entries["cooldown"].get())
+            self.config_state.stop_loss_pct = float(entries["sl"].get())
+            self.config_state.take_profit_pct = float(entries["tp"].get())
         except ValueError:
             messagebox.showerror("Invalid Input", "Max daily loss, cooldown, SL, and TP must be numeric.")
             return
@@ -270,10 +300,14 @@ class App(_CTK_BASE):  # type: ignore[misc]
         )
 
     def _poll_logs(self) -> None:
-        while not self.log_queue.empty():
-            msg = self.log_queue.get()
+        if self.log_buffer:
+            lines = []
+            while self.log_buffer:
+                lines.append(self.log_buffer.popleft())
+            # One insert per poll tick instead of one per line: each insert
+            # forces a Tk re-layout, which dominates under ticker bursts.
             self.log_text.configure(state="normal")
-            self.log_text.insert("end", msg + "\n")
+            self.log_text.insert("end", "\n".join(lines) + "\n")
             self.log_text.configure(state="disabled")
             self.log_text.see("end")
         self.after(500, self._poll_logs)
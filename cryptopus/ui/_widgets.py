@@ -0,0 +1,26 @@
+"""Memoized ctk-or-ttk widget class resolution shared by the tab builders."""
+from __future__ import annotations
+
+import functools
+from tkinter import ttk
+from types import SimpleNamespace
+
+
+@functools.lru_cache(maxsize=2)
+def get_widgetset(ctk) -> SimpleNamespace:
+    """The toolkit's widget classes, resolved once per toolkit.
+
+    Keyed on the customtkinter module (or None for plain ttk), so every
+    builder shares one resolution instead of re-branching per alias.
+    """
+    if ctk:
+        return SimpleNamespace(
+            Frame=ctk.CTkFrame, Label=ctk.CTkLabel, Group=ctk.CTkFrame,
+            Entry=ctk.CTkEntry, OptionMenu=ctk.CTkOptionMenu,
+            Button=ctk.CTkButton, CheckBox=ctk.CTkCheckBox,
+        )
+    return SimpleNamespace(
+        Frame=ttk.Frame, Label=ttk.Label, Group=ttk.LabelFrame,
+        Entry=ttk.Entry, OptionMenu=ttk.OptionMenu,
+        Button=ttk.Button, CheckBox=ttk.Checkbutton,
+    )
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import queue
+import threading
 import tkinter as tk
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, messagebox
 from typing import TYPE_CHECKING, List, Tuple
 
@@ -8,79 +13,175 @@ try:
     from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg  # type: ignore
     from matplotlib.figure import Figure  # type: ignore
     from matplotlib import dates as mdates  # type: ignore
+    from matplotlib.collections import LineCollection  # type: ignore
+    from matplotlib.lines import Line2D  # type: ignore
 except Exception:
     FigureCanvasTkAgg = None
     Figure = None
     mdates = None
+    LineCollection = None
+    Line2D = None
 
 from cryptopus.backtest import BacktestEngine, BacktestResult
+from cryptopus.config import SYMBOL_OPTIONS, TIMEFRAME_OPTIONS
 from cryptopus.strategies import STRATEGIES
+from cryptopus.ui._widgets import get_widgetset
 
 if TYPE_CHECKING:
     from cryptopus.ui import App
 
 
+_BACKTEST_CACHE_MAX_ENTRIES = 64
+
+
+def _configured_engine(app: App, slippage_pct: float) -> BacktestEngine:
+    """Build an engine for one run.
+
+    A fresh engine per run keeps the parameters immutable for its
+    lifetime, so an overlapping Compare and single-strategy run cannot
+    see each other's fees or risk settings. The jitted kernel is
+    module-level, so nothing warm is lost.
+    """
+    return BacktestEngine(
+        app.config_state.fee_rate,
+        slippage_pct=slippage_pct,
+        stop_loss_pct=app.config_state.stop_loss_pct,
+        take_profit_pct=app.config_state.take_profit_pct,
+    )
+
+
+def _date_nums(result: BacktestResult) -> np.ndarray:
+    """The result's bar times as matplotlib date numbers, computed once.
+
+    date2num over the raw datetime64 column is a vectorized subtraction,
+    and caching it on the result means a compare plot plus a single-tab
+    plot of the same (possibly cached) run convert exactly once.
+    """
+    if result._date_nums is None:
+        if result.timestamps_ms is not None:
+            result._date_nums = mdates.date2num(result.timestamps_ms.astype("datetime64[ms]"))
+        else:
+            result._date_nums = mdates.date2num(result.timestamps)
+    return result._date_nums
+
+
+def _cached_run(app: App, engine: BacktestEngine, ohlcv, strategy, cash: float,
+                symbol: str, timeframe: str) -> BacktestResult:
+    """engine.run memoized on the data fingerprint and run parameters.
+
+    First/last timestamp plus the last close fingerprint the candles (the
+    data engine refreshes the open bar in place under the same timestamp),
+    so Compare followed by a single-strategy run of the same setup reuses
+    the finished result instead of re-running the engine.
+    """
+    key = (symbol, timeframe, strategy.name, len(ohlcv),
+           float(ohlcv[0, 0]), float(ohlcv[-1, 0]), float(ohlcv[-1, 4]),
+           cash, engine.slippage_pct, engine.fee_rate,
+           engine.stop_loss_pct, engine.take_profit_pct)
+    cache = app.backtest_cache
+    result = cache.get(key)
+    if result is not None:
+        cache.move_to_end(key)
+        return result
+    result = engine.run(ohlcv, strategy, cash)
+    cache[key] = result
+    while len(cache) > _BACKTEST_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+    return result
+
+
 def build_backtest(frame: tk.Widget, app: App) -> None:
     ctk = app.ctk
+    # Per-strategy tabs each carry a matplotlib figure and canvas — the
+    # slowest widgets to construct — so they are built on first view
+    # rather than all at startup. Keyed by tab name/path, popped once.
+    builders: dict = {}
+
     if ctk:
-        sub_tabs = ctk.CTkTabview(frame)
+        def _on_tab_selected() -> None:
+            builder = builders.pop(sub_tabs.get(), None)
+            if builder:
+                builder()
+
+        sub_tabs = ctk.CTkTabview(frame, command=_on_tab_selected)
         sub_tabs.pack(fill="both", expand=True, padx=6, pady=2)
         sub_tabs.add("Compare")
         sub_tabs.add("Compare Returns")
         _build_compare(sub_tabs.tab("Compare"), app)
         _build_compare_returns(sub_tabs.tab("Compare Returns"), app)
-        for strat in STRATEGIES:
+
+        # One strategy tab per idle callback: the window paints first and
+        # the remaining tab headers trickle in between events.
+        strat_iter = iter(STRATEGIES)
+
+        def _add_next_tab() -> None:
+            strat = next(strat_iter, None)
+            if strat is None:
+                return
             sub_tabs.add(strat.name)
-            _build_single(sub_tabs.tab(strat.name), strat, app)
+            builders[strat.name] = (
+                lambda s=strat: _build_single(sub_tabs.tab(s.name), s, app)
+            )
+            frame.after_idle(_add_next_tab)
+
+        frame.after_idle(_add_next_tab)
         return
 
+    def _on_tab_changed(_event) -> None:
+        builder = builders.pop(sub_notebook.select(), None)
+        if builder:
+            builder()
+
     sub_notebook = ttk.Notebook(frame)
     sub_notebook.pack(fill="both", expand=True, padx=6, pady=2)
+    sub_notebook.bind("<<NotebookTabChanged>>", _on_tab_changed)
     compare_tab = ttk.Frame(sub_notebook)
     sub_notebook.add(compare_tab, text="Compare")
     _build_compare(compare_tab, app)
     compare_returns_tab = ttk.Frame(sub_notebook)
     sub_notebook.add(compare_returns_tab, text="Compare Returns")
     _build_compare_returns(compare_returns_tab, app)
-    for strat in STRATEGIES:
+    strat_iter = iter(STRATEGIES)
+
+    def _add_next_tab() -> None:
+        strat = next(strat_iter, None)
+        if strat is None:
+            return
         tab = ttk.Frame(sub_notebook)
         sub_notebook.add(tab, text=strat.name)
-        _build_single(tab, strat, app)
+        builders[str(tab)] = lambda f=tab, s=strat: _build_single(f, s, app)
+        frame.after_idle(_add_next_tab)
+
+    frame.after_idle(_add_next_tab)
 
 
 def _build_single(frame: tk.Widget, strategy, app: App) -> None:  # type: ignore
     ctk = app.ctk
-    Label = ctk.CTkLabel if ctk else ttk.Label
-    Frame = ctk.CTkFrame if ctk else ttk.Frame
-    Entry = ctk.CTkEntry if ctk else ttk.Entry
-    OptionMenu = ctk.CTkOptionMenu if ctk else ttk.OptionMenu
-    Button = ctk.CTkButton if ctk else ttk.Button
+    W = get_widgetset(ctk)
 
     symbol_var = tk.StringVar(value=app.config_state.symbol)
     timeframe_var = tk.StringVar(value=app.config_state.timeframe)
     cash_var = tk.StringVar(value=str(app.config_state.backtest_cash))
     slippage_var = tk.StringVar(value=str(app.config_state.backtest_slippage_pct))
 
-    Label(frame, text=f"{strategy.name} backtest").pack(pady=4)
+    W.Label(frame, text=f"{strategy.name} backtest").pack(pady=4)
 
-    input_row = Frame(frame)
+    input_row = W.Frame(frame)
     input_row.pack(pady=2)
-    Label(input_row, text="Symbol").pack(side="left", padx=4)
-    options = ["BTC/USD", "ETH/USD", "SOL/USD", "ADA/USD", "AVAX/USD"]
+    W.Label(input_row, text="Symbol").pack(side="left", padx=4)
     if ctk:
-        OptionMenu(input_row, values=options, variable=symbol_var).pack(side="left", padx=4)
+        W.OptionMenu(input_row, values=list(SYMBOL_OPTIONS), variable=symbol_var).pack(side="left", padx=4)
     else:
-        OptionMenu(input_row, symbol_var, options[0], *options).pack(side="left", padx=4)
-    Label(input_row, text="Timeframe").pack(side="left", padx=4)
-    tf_options = ["1m", "5m", "15m", "1h", "4h"]
+        W.OptionMenu(input_row, symbol_var, SYMBOL_OPTIONS[0], *SYMBOL_OPTIONS).pack(side="left", padx=4)
+    W.Label(input_row, text="Timeframe").pack(side="left", padx=4)
     if ctk:
-        OptionMenu(input_row, values=tf_options, variable=timeframe_var).pack(side="left", padx=4)
+        W.OptionMenu(input_row, values=list(TIMEFRAME_OPTIONS), variable=timeframe_var).pack(side="left", padx=4)
     else:
-        OptionMenu(input_row, timeframe_var, tf_options[1], *tf_options).pack(side="left", padx=4)
-    Label(input_row, text="Start USD").pack(side="left", padx=4)
-    Entry(input_row, textvariable=cash_var, width=80 if ctk else 8).pack(side="left", padx=4)
-    Label(input_row, text="Slippage %").pack(side="left", padx=4)
-    Entry(input_row, textvariable=slippage_var, width=70 if ctk else 6).pack(side="left", padx=4)
+        W.OptionMenu(input_row, timeframe_var, TIMEFRAME_OPTIONS[1], *TIMEFRAME_OPTIONS).pack(side="left", padx=4)
+    W.Label(input_row, text="Start USD").pack(side="left", padx=4)
+    W.Entry(input_row, textvariable=cash_var, width=80 if ctk else 8).pack(side="left", padx=4)
+    W.Label(input_row, text="Slippage %").pack(side="left", padx=4)
+    W.Entry(input_row, textvariable=slippage_var, width=70 if ctk else 6).pack(side="left", padx=4)
 
     if ctk:
         result_box = ctk.CTkTextbox(frame, height=95, wrap="word")
@@ -89,11 +190,17 @@ def _build_single(frame: tk.Widget, strategy, app: App) -> None:  # type: ignore
         result_box = tk.Text(frame, height=5, wrap="word", state="disabled")
     result_box.pack(fill="x", padx=10, pady=4)
 
-    plot_frame = Frame(frame)
+    plot_frame = W.Frame(frame)
     plot_frame.pack(fill="both", expand=True, padx=8, pady=4)
 
     canvas = None
+    locator = formatter = None
     if FigureCanvasTkAgg and Figure:
+        if mdates:
+            # Built once; ax.clear() detaches them, so redraws reattach the
+            # same objects instead of allocating new ones.
+            locator = mdates.AutoDateLocator(minticks=3, maxticks=8)
+            formatter = mdates.ConciseDateFormatter(locator)
         fig = Figure(figsize=(7.5, 5.2), dpi=100)
         ax_equity = fig.add_subplot(2, 1, 1)
         ax_dd = fig.add_subplot(2, 1, 2, sharex=ax_equity)
@@ -106,7 +213,10 @@ def _build_single(frame: tk.Widget, strategy, app: App) -> None:  # type: ignore
         canvas = FigureCanvasTkAgg(fig, master=plot_frame)
         canvas.get_tk_widget().pack(fill="both", expand=True)
     else:
-        Label(plot_frame, text="matplotlib not installed; plots disabled.").pack(pady=6)
+        W.Label(plot_frame, text="matplotlib not installed; plots disabled.").pack(pady=6)
+
+    result_queue: queue.Queue = queue.Queue()
+    layout_done = [False]
 
     def run_backtest() -> None:
         try:
@@ -118,21 +228,48 @@ def _build_single(frame: tk.Widget, strategy, app: App) -> None:  # type: ignore
             slippage = float(slippage_var.get())
         except ValueError:
             slippage = 0.0
-        ohlcv = app.data_engine.fetch_ohlcv(symbol_var.get(), timeframe_var.get(), limit=500)
-        if not ohlcv:
+        symbol = symbol_var.get()
+        timeframe = timeframe_var.get()
+        run_btn.configure(state="disabled")
+
+        def worker() -> None:
+            # Always enqueue something: a silent death here would leave
+            # _drain_result polling and the button disabled forever.
+            try:
+                ohlcv = app.data_engine.fetch_ohlcv_array(symbol, timeframe, limit=500)
+                if ohlcv is None or not len(ohlcv):
+                    result_queue.put(None)
+                    return
+                engine = _configured_engine(app, slippage)
+                result = _cached_run(app, engine, ohlcv, strategy, cash, symbol, timeframe)
+                result_queue.put((result, symbol, timeframe, cash))
+            except Exception as exc:
+                app.logger.log(f"Backtest failed: {exc}")
+                result_queue.put(exc)
+
+        threading.Thread(target=worker, daemon=True).start()
+        frame.after(100, _drain_result)
+
+    def _drain_result() -> None:
+        try:
+            item = result_queue.get_nowait()
+        except queue.Empty:
+            frame.after(100, _drain_result)
+            return
+        run_btn.configure(state="normal")
+        if item is None:
             messagebox.showerror("No Data", "Could not load OHLCV data.")
             return
-        engine = BacktestEngine(
-            app.config_state.fee_rate,
-            slippage_pct=slippage,
-            stop_loss_pct=app.config_state.stop_loss_pct,
-            take_profit_pct=app.config_state.take_profit_pct,
-        )
-        result = engine.run(ohlcv, strategy, cash)
+        if isinstance(item, Exception):
+            messagebox.showerror("Backtest Failed", str(item))
+            return
+        _show_result(*item)
+
+    def _show_result(result, symbol: str, timeframe: str, cash: float) -> None:
         result_box.configure(state="normal")
         result_box.delete("1.0", "end")
         bh_return = 0.0
-        if result.buy_hold_curve and result.buy_hold_curve[0]:
+        if len(result.buy_hold_curve) and result.buy_hold_curve[0]:
             bh_return = (result.buy_hold_curve[-1] - result.buy_hold_curve[0]) / result.buy_hold_curve[0] * 100
         beat_bh = result.return_pct - bh_return
         result_box.insert(
@@ -152,67 +289,64 @@ def _build_single(frame: tk.Widget, strategy, app: App) -> None:  # type: ignore
             ax_dd = fig.axes[1]
             ax_equity.clear()
             ax_dd.clear()
-            ax_equity.set_title(f"Equity Curve ({symbol_var.get()} {timeframe_var.get()})")
+            ax_equity.set_title(f"Equity Curve ({symbol} {timeframe})")
             ax_equity.set_ylabel("USD")
             ax_dd.set_title("Drawdown")
             ax_dd.set_ylabel("%")
             ax_dd.set_xlabel("Time (UTC)")
-            ax_equity.plot(result.timestamps, result.equity_curve, color="#2c7fb8", label=strategy.name)
-            if result.buy_hold_curve:
-                ax_equity.plot(result.timestamps, result.buy_hold_curve, color="#999999", linestyle="--", label="Buy & Hold")
-                bh_ret = (result.buy_hold_curve[-1] - result.buy_hold_curve[0]) / result.buy_hold_curve[0] * 100 if result.buy_hold_curve[0] else 0
+            xs = _date_nums(result) if mdates else result.timestamps
+            ax_equity.plot(xs, result.equity_curve, color="#2c7fb8", label=strategy.name)
+            if len(result.buy_hold_curve):
+                ax_equity.plot(xs, result.buy_hold_curve, color="#999999", linestyle="--", label="Buy & Hold")
                 ax_equity.legend(loc="best", fontsize=8)
-            ax_dd.plot(result.timestamps, result.drawdowns, color="#d95f0e")
+            ax_dd.plot(xs, result.drawdowns, color="#d95f0e")
             if mdates:
-                locator = mdates.AutoDateLocator(minticks=3, maxticks=8)
-                formatter = mdates.ConciseDateFormatter(locator)
                 ax_equity.xaxis.set_major_locator(locator)
                 ax_equity.xaxis.set_major_formatter(formatter)
                 ax_dd.xaxis.set_major_locator(locator)
                 ax_dd.xaxis.set_major_formatter(formatter)
+            # tick_params covers labels the locator creates later, unlike
+            # the old per-label loop which only touched the current set.
             for ax in (ax_equity, ax_dd):
-                for label in ax.get_xticklabels():
-                    label.set_rotation(45)
-                    label.set_ha("right")
-            fig.tight_layout()
-            canvas.draw()
+                ax.tick_params(axis="x", labelrotation=45)
+            # One layout solve when tick labels first exist; later runs keep
+            # the geometry instead of re-solving on every redraw.
+            if not layout_done[0]:
+                fig.tight_layout()
+                layout_done[0] = True
+            canvas.draw_idle()
 
-    Button(input_row, text="Run Backtest", command=run_backtest).pack(side="left", padx=6)
+    run_btn = W.Button(input_row, text="Run Backtest", command=run_backtest)
+    run_btn.pack(side="left", padx=6)
 
 
 def _build_compare(frame: tk.Widget, app: App) -> None:
     ctk = app.ctk
-    Label = ctk.CTkLabel if ctk else ttk.Label
-    Frame = ctk.CTkFrame if ctk else ttk.Frame
-    Entry = ctk.CTkEntry if ctk else ttk.Entry
-    OptionMenu = ctk.CTkOptionMenu if ctk else ttk.OptionMenu
-    Button = ctk.CTkButton if ctk else ttk.Button
+    W = get_widgetset(ctk)
 
     symbol_var = tk.StringVar(value=app.config_state.symbol)
     timeframe_var = tk.StringVar(value=app.config_state.timeframe)
     cash_var = tk.StringVar(value=str(app.config_state.backtest_cash))
     slippage_var = tk.StringVar(value=str(app.config_state.backtest_slippage_pct))
 
-    Label(frame, text="Compare strategies").pack(pady=4)
+    W.Label(frame, text="Compare strategies").pack(pady=4)
 
-    input_row = Frame(frame)
+    input_row = W.Frame(frame)
     input_row.pack(pady=2)
-    Label(input_row, text="Symbol").pack(side="left", padx=4)
-    options = ["BTC/USD", "ETH/USD", "SOL/USD", "ADA/USD", "AVAX/USD"]
+    W.Label(input_row, text="Symbol").pack(side="left", padx=4)
     if ctk:
-        OptionMenu(input_row, values=options, variable=symbol_var).pack(side="left", padx=4)
+        W.OptionMenu(input_row, values=list(SYMBOL_OPTIONS), variable=symbol_var).pack(side="left", padx=4)
     else:
-        OptionMenu(input_row, symbol_var, options[0], *options).pack(side="left", padx=4)
-    Label(input_row, text="Timeframe").pack(side="left", padx=4)
-    tf_options = ["1m", "5m", "15m", "1h", "4h"]
+        W.OptionMenu(input_row, symbol_var, SYMBOL_OPTIONS[0], *SYMBOL_OPTIONS).pack(side="left", padx=4)
+    W.Label(input_row, text="Timeframe").pack(side="left", padx=4)
     if ctk:
-        OptionMenu(input_row, values=tf_options, variable=timeframe_var).pack(side="left", padx=4)
+        W.OptionMenu(input_row, values=list(TIMEFRAME_OPTIONS), variable=timeframe_var).pack(side="left", padx=4)
     else:
-        OptionMenu(input_row, timeframe_var, tf_options[1], *tf_options).pack(side="left", padx=4)
-    Label(input_row, text="Start USD").pack(side="left", padx=4)
-    Entry(input_row, textvariable=cash_var, width=80 if ctk else 8).pack(side="left", padx=4)
-    Label(input_row, text="Slippage %").pack(side="left", padx=4)
-    Entry(input_row, textvariable=slippage_var, width=70 if ctk else 6).pack(side="left", padx=4)
+        W.OptionMenu(input_row, timeframe_var, TIMEFRAME_OPTIONS[1], *TIMEFRAME_OPTIONS).pack(side="left", padx=4)
+    W.Label(input_row, text="Start USD").pack(side="left", padx=4)
+    W.Entry(input_row, textvariable=cash_var, width=80 if ctk else 8).pack(side="left", padx=4)
+    W.Label(input_row, text="Slippage %").pack(side="left", padx=4)
+    W.Entry(input_row, textvariable=slippage_var, width=70 if ctk else 6).pack(side="left", padx=4)
 
     if ctk:
         result_box = ctk.CTkTextbox(frame, height=65, wrap="word")
@@ -221,24 +355,21 @@ def _build_compare(frame: tk.Widget, app: App) -> None:
         result_box = tk.Text(frame, height=3, wrap="word", state="disabled")
     result_box.pack(fill="x", padx=10, pady=4)
 
-    metrics_tree = ttk.Treeview(
-        frame,
-        columns=("strategy", "return", "bh_return", "vs_bh", "max_dd", "win_rate", "trades"),
-        show="headings",
-        height=4,
-    )
+    columns = ("strategy", "return", "bh_return", "vs_bh", "max_dd", "win_rate", "trades")
+    metrics_tree = ttk.Treeview(frame, columns=columns, show="headings", height=4)
+    col_index = {col: idx for idx, col in enumerate(columns)}
+    # Raw per-row values by item id, so sorting never reads cells back from
+    # Tcl or re-parses the display strings.
+    row_keys: dict = {}
 
     def _sort_tree(col: str, descending: bool) -> None:
-        rows = []
-        for item in metrics_tree.get_children(""):
-            value = metrics_tree.set(item, col)
-            try:
-                key = float(value)
-            except ValueError:
-                key = value
-            rows.append((key, item))
-        rows.sort(reverse=descending, key=lambda x: x[0])
-        for index, (_, item) in enumerate(rows):
+        idx = col_index[col]
+        items = sorted(
+            metrics_tree.get_children(""),
+            key=lambda item: row_keys[item][idx],
+            reverse=descending,
+        )
+        for index, item in enumerate(items):
             metrics_tree.move(item, "", index)
         metrics_tree.heading(col, command=lambda: _sort_tree(col, not descending))
 
@@ -258,6 +389,8 @@ def _build_compare(frame: tk.Widget, app: App) -> None:
     metrics_tree.column("trades", width=60)
     metrics_tree.pack(fill="x", padx=10, pady=4)
 
+    result_queue: queue.Queue = queue.Queue()
+
     def run_compare() -> None:
         try:
             cash = float(cash_var.get())
@@ -268,70 +401,115 @@ def _build_compare(frame: tk.Widget, app: App) -> None:
             slippage = float(slippage_var.get())
         except ValueError:
             slippage = 0.0
-        ohlcv = app.data_engine.fetch_ohlcv(symbol_var.get(), timeframe_var.get(), limit=800)
-        if not ohlcv:
+        symbol = symbol_var.get()
+        timeframe = timeframe_var.get()
+        compare_btn.configure(state="disabled")
+
+        def worker() -> None:
+            # Always enqueue something: a silent death here would leave
+            # _drain_result polling and the button disabled forever.
+            try:
+                ohlcv = app.data_engine.fetch_ohlcv_array(symbol, timeframe, limit=800)
+                if ohlcv is None or not len(ohlcv):
+                    result_queue.put(None)
+                    return
+                engine = _configured_engine(app, slippage)
+                # All strategies share the same read-only OHLCV slice and the
+                # numba kernel releases the GIL, so threads parallelize the five
+                # runs without the pickling a process pool would need.
+                with ThreadPoolExecutor(max_workers=len(STRATEGIES)) as pool:
+                    runs = pool.map(
+                        lambda strat: _cached_run(app, engine, ohlcv, strat, cash, symbol, timeframe),
+                        STRATEGIES,
+                    )
+                    results = [(strat.name, result) for strat, result in zip(STRATEGIES, runs)]
+                result_queue.put((results, symbol, timeframe))
+            except Exception as exc:
+                app.logger.log(f"Backtest compare failed: {exc}")
+                result_queue.put(exc)
+
+        threading.Thread(target=worker, daemon=True).start()
+        frame.after(100, _drain_result)
+
+    def _drain_result() -> None:
+        try:
+            item = result_queue.get_nowait()
+        except queue.Empty:
+            frame.after(100, _drain_result)
+            return
+        compare_btn.configure(state="normal")
+        if item is None:
             messagebox.showerror("No Data", "Could not load OHLCV data.")
             return
-        engine = BacktestEngine(
-            app.config_state.fee_rate,
-            slippage_pct=slippage,
-            stop_loss_pct=app.config_state.stop_loss_pct,
-            take_profit_pct=app.config_state.take_profit_pct,
+        if isinstance(item, Exception):
+            messagebox.showerror("Backtest Failed", str(item))
+            return
+        _show_compare(*item)
+
+    def _show_compare(results, symbol: str, timeframe: str) -> None:
+        names = [name for name, _ in results]
+        returns = np.fromiter((r.return_pct for _, r in results), dtype=np.float64)
+        max_dds = np.fromiter((r.max_dd for _, r in results), dtype=np.float64)
+        first = np.fromiter(
+            (r.buy_hold_curve[0] if len(r.buy_hold_curve) else np.nan for _, r in results),
+            dtype=np.float64,
         )
-        results = []
-        for strat in STRATEGIES:
-            results.append((strat.name, engine.run(ohlcv, strat, cash)))
-
-        best_return = max(results, key=lambda item: item[1].return_pct)
-        best_risk = max(
-            results,
-            key=lambda item: (item[1].return_pct / item[1].max_dd) if item[1].max_dd > 0 else item[1].return_pct,
+        last = np.fromiter(
+            (r.buy_hold_curve[-1] if len(r.buy_hold_curve) else np.nan for _, r in results),
+            dtype=np.float64,
         )
+        # Missing or zero-start curves fall back to 0%, as before.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bh_rets = np.nan_to_num((last - first) / first * 100.0,
+                                    nan=0.0, posinf=0.0, neginf=0.0)
+        vs_bh = returns - bh_rets
+        best_return = int(returns.argmax())
+        best_risk = int(np.where(max_dds > 0, returns / max_dds, returns).argmax())
+
         result_box.configure(state="normal")
         result_box.delete("1.0", "end")
         result_box.insert(
             "end",
-            f"Best return: {best_return[0]} ({best_return[1].return_pct:.2f}%)\n"
-            f"Best risk-adjusted: {best_risk[0]} "
-            f"({best_risk[1].return_pct:.2f}% / {best_risk[1].max_dd:.2f}%)\n"
-            f"Compared {len(results)} strategies on {symbol_var.get()} {timeframe_var.get()}.\n",
+            f"Best return: {names[best_return]} ({returns[best_return]:.2f}%)\n"
+            f"Best risk-adjusted: {names[best_risk]} "
+            f"({returns[best_risk]:.2f}% / {max_dds[best_risk]:.2f}%)\n"
+            f"Compared {len(results)} strategies on {symbol} {timeframe}.\n",
         )
         result_box.configure(state="disabled")
 
         metrics_tree.delete(*metrics_tree.get_children())
-        for name, result in results:
-            bh_ret = 0.0
-            if result.buy_hold_curve and result.buy_hold_curve[0]:
-                bh_ret = (result.buy_hold_curve[-1] - result.buy_hold_curve[0]) / result.buy_hold_curve[0] * 100
-            vs_bh = result.return_pct - bh_ret
-            metrics_tree.insert(
+        row_keys.clear()
+        for idx, (name, result) in enumerate(results):
+            item = metrics_tree.insert(
                 "",
                 "end",
                 values=(
                     name,
-                    f"{result.return_pct:.2f}",
-                    f"{bh_ret:.2f}",
-                    f"{vs_bh:+.2f}",
-                    f"{result.max_dd:.2f}",
+                    f"{returns[idx]:.2f}",
+                    f"{bh_rets[idx]:.2f}",
+                    f"{vs_bh[idx]:+.2f}",
+                    f"{max_dds[idx]:.2f}",
                     f"{result.win_rate:.1f}",
                     result.trades,
                 ),
             )
+            row_keys[item] = (name, returns[idx], bh_rets[idx], vs_bh[idx],
+                              max_dds[idx], result.win_rate, result.trades)
 
-        _update_compare_plot(app, results, symbol_var.get(), timeframe_var.get())
+        _update_compare_plot(app, results, symbol, timeframe)
 
-    Button(input_row, text="Run Comparison", command=run_compare).pack(side="left", padx=6)
+    compare_btn = W.Button(input_row, text="Run Comparison", command=run_compare)
+    compare_btn.pack(side="left", padx=6)
 
     _build_compare_equity(frame, app)
 
 
 def _build_compare_equity(frame: tk.Widget, app: App) -> None:
-    Label = app.ctk.CTkLabel if app.ctk else ttk.Label
-    Frame = app.ctk.CTkFrame if app.ctk else ttk.Frame
-    info = Label(frame, text="Run a comparison to render plots.", font=("Segoe UI", 11))
+    W = get_widgetset(app.ctk)
+    info = W.Label(frame, text="Run a comparison to render plots.", font=("Segoe UI", 11))
     info.pack(pady=6)
 
-    plot_frame = Frame(frame)
+    plot_frame = W.Frame(frame)
     plot_frame.pack(fill="both", expand=True, padx=8, pady=4)
 
     if FigureCanvasTkAgg and Figure:
@@ -339,21 +517,24 @@ def _build_compare_equity(frame: tk.Widget, app: App) -> None:
         ax = fig.add_subplot(1, 1, 1)
         ax.set_title("Equity Curve Comparison")
         ax.set_ylabel("USD")
+        ax.tick_params(axis="x", labelrotation=45)
         fig.tight_layout()
         canvas = FigureCanvasTkAgg(fig, master=plot_frame)
         canvas.get_tk_widget().pack(fill="both", expand=True)
-        app.compare_plot["equity"].update({"canvas": canvas, "fig": fig, "ax": ax, "info": info})
+        app.compare_plot["equity"].update(
+            {"canvas": canvas, "fig": fig, "ax": ax, "info": info,
+             "collection": None, "bh_line": None}
+        )
     else:
-        Label(plot_frame, text="matplotlib not installed; plots disabled.").pack(pady=6)
+        W.Label(plot_frame, text="matplotlib not installed; plots disabled.").pack(pady=6)
 
 
 def _build_compare_returns(frame: tk.Widget, app: App) -> None:
-    Label = app.ctk.CTkLabel if app.ctk else ttk.Label
-    Frame = app.ctk.CTkFrame if app.ctk else ttk.Frame
-    info = Label(frame, text="Run a comparison to render plots.", font=("Segoe UI", 11))
+    W = get_widgetset(app.ctk)
+    info = W.Label(frame, text="Run a comparison to render plots.", font=("Segoe UI", 11))
     info.pack(pady=6)
 
-    plot_frame = Frame(frame)
+    plot_frame = W.Frame(frame)
     plot_frame.pack(fill="both", expand=True, padx=8, pady=4)
 
     if FigureCanvasTkAgg and Figure:
@@ -366,7 +547,7 @@ def _build_compare_returns(frame: tk.Widget, app: App) -> None:
         canvas.get_tk_widget().pack(fill="both", expand=True)
         app.compare_plot["returns"].update({"canvas": canvas, "fig": fig, "ax": ax, "info": info})
     else:
-        Label(plot_frame, text="matplotlib not installed; plots disabled.").pack(pady=6)
+        W.Label(plot_frame, text="matplotlib not installed; plots disabled.").pack(pady=6)
 
 
 def _update_compare_plot(app: App, results: List[Tuple[str, BacktestResult]], symbol: str, timeframe: str) -> None:
@@ -378,35 +559,57 @@ def _update_compare_plot(app: App, results: List[Tuple[str, BacktestResult]], sy
     eq_ax = equity.get("ax")
     eq_info = equity.get("info")
     if eq_canvas and eq_ax:
-        eq_ax.clear()
         eq_ax.set_title(f"Equity Curve Comparison ({symbol} {timeframe})")
-        eq_ax.set_ylabel("USD")
 
+        # All strategy curves render through one persistent LineCollection:
+        # a single artist draws N curves in one pass, and set_segments
+        # replaces per-curve set_data calls across runs.
         colors = ["#2c7fb8", "#7fcdbb", "#fdae61", "#d95f0e", "#7b3294"]
-        for idx, (name, result) in enumerate(results):
-            color = colors[idx % len(colors)]
-            eq_ax.plot(result.timestamps, result.equity_curve, label=name, color=color)
-
-        # Add buy-and-hold benchmark (from first result since data is the same)
-        if results and results[0][1].buy_hold_curve:
-            eq_ax.plot(
-                results[0][1].timestamps, results[0][1].buy_hold_curve,
-                color="#999999", linestyle="--", linewidth=2, label="Buy & Hold",
-            )
-
-        eq_ax.legend(loc="best", fontsize=8)
-        if results and mdates:
+        collection = equity.get("collection")
+        if collection is None:
+            collection = LineCollection([], linewidths=1.2)
+            eq_ax.add_collection(collection)
+            equity["collection"] = collection
+        segments = [
+            np.column_stack([_date_nums(result), result.equity_curve])
+            for _, result in results
+        ]
+        collection.set_segments(segments)
+        collection.set_color([colors[idx % len(colors)] for idx in range(len(results))])
+
+        # Buy-and-hold benchmark (from first result since data is the same)
+        bh_line = equity.get("bh_line")
+        if results and len(results[0][1].buy_hold_curve):
+            if bh_line is None:
+                bh_line, = eq_ax.plot(
+                    [], [], color="#999999", linestyle="--", linewidth=2, label="Buy & Hold",
+                )
+                equity["bh_line"] = bh_line
+            bh_line.set_data(_date_nums(results[0][1]), results[0][1].buy_hold_curve)
+
+        if equity.get("legend") is None:
+            # Proxy artists: the collection itself carries no per-curve labels.
+            handles = [
+                Line2D([], [], color=colors[idx % len(colors)], label=name)
+                for idx, (name, _) in enumerate(results)
+            ]
+            if bh_line is not None:
+                handles.append(bh_line)
+            equity["legend"] = eq_ax.legend(handles=handles, loc="best", fontsize=8)
+        if results and mdates and equity.get("locator") is None:
             locator = mdates.AutoDateLocator(minticks=3, maxticks=8)
             formatter = mdates.ConciseDateFormatter(locator)
             eq_ax.xaxis.set_major_locator(locator)
             eq_ax.xaxis.set_major_formatter(formatter)
-        for label in eq_ax.get_xticklabels():
-            label.set_rotation(45)
-            label.set_ha("right")
+            equity["locator"] = locator
+        eq_ax.relim()
+        # relim only walks lines; merge the collection's points explicitly.
+        if segments:
+            eq_ax.update_datalim(np.vstack(segments))
+        eq_ax.autoscale_view()
         if eq_info:
-            eq_info.configure(text=f"Data: {symbol} {timeframe}, {len(results[0][1].timestamps)} candles (UTC)")
-        equity["fig"].tight_layout()
-        eq_canvas.draw()
+            eq_info.configure(text=f"Data: {symbol} {timeframe}, {len(_date_nums(results[0][1]))} candles (UTC)")
+        eq_canvas.draw_idle()
 
     # Returns plot
     ret_canvas = returns_plot.get("canvas")
@@ -417,24 +620,19 @@ def _update_compare_plot(app: App, results: List[Tuple[str, BacktestResult]], sy
         ret_ax.set_title("Return vs Max Drawdown")
         ret_ax.set_ylabel("%")
 
-        names = []
-        returns = []
-        max_dds = []
-        for name, result in results:
-            names.append(name)
-            returns.append(result.return_pct)
-            max_dds.append(result.max_dd)
-
-        x = range(len(names))
-        ret_ax.bar([i - 0.2 for i in x], returns, width=0.4, label="Return", color="#2c7fb8")
-        ret_ax.bar([i + 0.2 for i in x], max_dds, width=0.4, label="Max DD", color="#d95f0e")
-        ret_ax.set_xticks(list(x))
-        ret_ax.set_xticklabels(names, rotation=20, ha="right")
+        names = [name for name, _ in results]
+        returns = np.fromiter((r.return_pct for _, r in results), dtype=np.float64, count=len(results))
+        max_dds = np.fromiter((r.max_dd for _, r in results), dtype=np.float64, count=len(results))
+
+        x = np.arange(len(names))
+        ret_ax.bar(x - 0.2, returns, width=0.4, label="Return", color="#2c7fb8")
+        ret_ax.bar(x + 0.2, max_dds, width=0.4, label="Max DD", color="#d95f0e")
+        ret_ax.set_xticks(x)
+        ret_ax.set_xticklabels(names, rotation=45, ha="right")
         ret_ax.legend(loc="upper right")
-        for label in ret_ax.get_xticklabels():
-            label.set_rotation(45)
-            label.set_ha("right")
         if ret_info:
-            ret_info.configure(text=f"Data: {symbol} {timeframe}, {len(results[0][1].timestamps)} candles (UTC)")
-        returns_plot["fig"].tight_layout()
-        ret_canvas.draw()
+            ret_info.configure(text=f"Data: {symbol} {timeframe}, {len(_date_nums(results[0][1]))} candles (UTC)")
+        if not returns_plot.get("layout_done"):
+            returns_plot["fig"].tight_layout()
+            returns_plot["layout_done"] = True
+        ret_canvas.draw_idle()
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING, List
+from collections import deque
+from typing import TYPE_CHECKING, Deque
 from datetime import datetime, timezone
 
 try:
@@ -75,9 +76,10 @@ def build_overview(frame: tk.Widget, app: App) -> None:
     app._pnl_label = Label(pnl_frame, text="Realized P&L today: $0.00", font=("Segoe UI", 10))
     app._pnl_label.pack(anchor="w", padx=4)
 
-    # P&L data storage
-    app._pnl_timestamps: List[datetime] = []
-    app._pnl_values: List[float] = []
+    # P&L data storage; maxlen keeps the last 500 samples without the
+    # O(N) reslice a list would need every tick past the cap.
+    app._pnl_timestamps: Deque[datetime] = deque(maxlen=500)
+    app._pnl_values: Deque[float] = deque(maxlen=500)
 
     if FigureCanvasTkAgg and Figure:
         fig = Figure(figsize=(8, 2.5), dpi=100)
@@ -85,16 +87,27 @@ def build_overview(frame: tk.Widget, app: App) -> None:
         ax.set_ylabel("P&L ($)", fontsize=9)
         ax.axhline(y=0, color="#999999", linewidth=0.8, linestyle="--")
         ax.set_title("Realized P&L", fontsize=10)
+        # Static decorations (labels, title, locator, layout) are set up
+        # once; the poll only moves the line and fill artists.
+        (line,) = ax.plot([], [], color="#4CAF50", linewidth=1.5)
+        if mdates:
+            locator = mdates.AutoDateLocator(minticks=3, maxticks=6)
+            ax.xaxis.set_major_locator(locator)
+            ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
         fig.tight_layout()
         canvas = FigureCanvasTkAgg(fig, master=pnl_frame)
         canvas.get_tk_widget().pack(fill="both", expand=True)
         app._pnl_canvas = canvas
         app._pnl_fig = fig
         app._pnl_ax = ax
+        app._pnl_line = line
+        app._pnl_fill = None
     else:
         app._pnl_canvas = None
         app._pnl_fig = None
         app._pnl_ax = None
+        app._pnl_line = None
+        app._pnl_fill = None
         Label(pnl_frame, text="Install matplotlib for live P&L chart.").pack(pady=6)
 
     # Start polling P&L updates
@@ -114,29 +127,34 @@ def _poll_pnl(app: App) -> None:
     app._pnl_timestamps.append(now)
     app._pnl_values.append(pnl)
 
-    # Keep last 500 data points
-    if len(app._pnl_timestamps) > 500:
-        app._pnl_timestamps = app._pnl_timestamps[-500:]
-        app._pnl_values = app._pnl_values[-500:]
+    # While another tab is showing, keep sampling but skip the draw and
+    # back off the poll; the chart catches up on the next visible tick.
+    visible = True
+    if app._pnl_canvas:
+        try:
+            visible = bool(app._pnl_canvas.get_tk_widget().winfo_viewable())
+        except tk.TclError:
+            visible = False
 
-    if app._pnl_canvas and app._pnl_ax and len(app._pnl_timestamps) > 1:
+    if visible and app._pnl_canvas and app._pnl_ax and len(app._pnl_timestamps) > 1:
         ax = app._pnl_ax
-        ax.clear()
-        ax.set_ylabel("P&L ($)", fontsize=9)
-        ax.set_title("Realized P&L", fontsize=10)
-        ax.axhline(y=0, color="#999999", linewidth=0.8, linestyle="--")
-
         fill_color = "#4CAF50" if pnl >= 0 else "#F44336"
-        ax.plot(app._pnl_timestamps, app._pnl_values, color=fill_color, linewidth=1.5)
-        ax.fill_between(app._pnl_timestamps, app._pnl_values, 0, alpha=0.15, color=fill_color)
-
-        if mdates:
-            locator = mdates.AutoDateLocator(minticks=3, maxticks=6)
-            formatter = mdates.ConciseDateFormatter(locator)
-            ax.xaxis.set_major_locator(locator)
-            ax.xaxis.set_major_formatter(formatter)
-
-        app._pnl_fig.tight_layout()
+        app._pnl_line.set_data(app._pnl_timestamps, app._pnl_values)
+        app._pnl_line.set_color(fill_color)
+        # fill_between builds a new polygon from every point, so the old
+        # collection is swapped out rather than the whole axes cleared.
+        if app._pnl_fill is not None:
+            app._pnl_fill.remove()
+        app._pnl_fill = ax.fill_between(
+            app._pnl_timestamps, app._pnl_values, 0, alpha=0.15, color=fill_color,
+        )
+        ax.relim()
+        ax.autoscale_view()
+        # relim only tracks the line; keep the zero baseline in view so the
+        # fill is never clipped.
+        ymin, ymax = ax.get_ylim()
+        if ymin > 0 or ymax < 0:
+            ax.set_ylim(min(ymin, 0.0), max(ymax, 0.0))
         app._pnl_canvas.draw_idle()
 
-    app.after(2000, lambda: _poll_pnl(app))
+    app.after(2000 if visible else 10000, lambda: _poll_pnl(app))
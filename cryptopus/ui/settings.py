@@ -4,6 +4,8 @@ import tkinter as tk
 from tkinter import ttk
 from typing import TYPE_CHECKING
 
+from cryptopus.config import EXCHANGE_OPTIONS, SYMBOL_OPTIONS, TIMEFRAME_OPTIONS
+from cryptopus.ui._widgets import get_widgetset
 from cryptopus.ui.tooltip import ToolTip
 
 if TYPE_CHECKING:
@@ -12,12 +14,9 @@ if TYPE_CHECKING:
 
 def build_settings(frame: ttk.Frame, app: App) -> None:
     ctk = app.ctk
-    Frame = ctk.CTkFrame if ctk else ttk.Frame
-    Label = ctk.CTkLabel if ctk else ttk.Label
-    Group = ctk.CTkFrame if ctk else ttk.LabelFrame
-    Entry = ctk.CTkEntry if ctk else ttk.Entry
-    OptionMenu = ctk.CTkOptionMenu if ctk else ttk.OptionMenu
-    Button = ctk.CTkButton if ctk else ttk.Button
+    w = get_widgetset(ctk)
+    Frame, Label, Group = w.Frame, w.Label, w.Group
+    Entry, OptionMenu = w.Entry, w.OptionMenu
 
     if ctk:
         inner = ctk.CTkScrollableFrame(frame)
@@ -48,11 +47,10 @@ def build_settings(frame: ttk.Frame, app: App) -> None:
     lbl.pack(side="left")
     ToolTip(lbl, "Which crypto exchange to connect to.\nRequires API keys in config.json for live trading.")
     app.exchange_var = tk.StringVar(value=app.config_state.exchange)
-    exchange_options = ["coinbase", "kraken", "binance", "bybit", "alpaca"]
     if ctk:
-        OptionMenu(row, values=exchange_options, variable=app.exchange_var).pack(side="left", padx=8)
+        OptionMenu(row, values=list(EXCHANGE_OPTIONS), variable=app.exchange_var).pack(side="left", padx=8)
     else:
-        OptionMenu(row, app.exchange_var, exchange_options[0], *exchange_options).pack(side="left", padx=8)
+        OptionMenu(row, app.exchange_var, EXCHANGE_OPTIONS[0], *EXCHANGE_OPTIONS).pack(side="left", padx=8)
 
     # Symbol
     row = Frame(basic)
@@ -61,11 +59,10 @@ def build_settings(frame: ttk.Frame, app: App) -> None:
     lbl.pack(side="left")
     ToolTip(lbl, "The trading pair to watch and trade.\nBTC/USD = Bitcoin priced in US dollars.")
     app.symbol_var = tk.StringVar(value=app.config_state.symbol)
-    symbol_options = ["BTC/USD", "ETH/USD", "SOL/USD", "ADA/USD", "AVAX/USD"]
     if ctk:
-        OptionMenu(row, values=symbol_options, variable=app.symbol_var).pack(side="left", padx=8)
+        OptionMenu(row, values=list(SYMBOL_OPTIONS), variable=app.symbol_var).pack(side="left", padx=8)
     else:
-        OptionMenu(row, app.symbol_var, symbol_options[0], *symbol_options).pack(side="left", padx=8)
+        OptionMenu(row, app.symbol_var, SYMBOL_OPTIONS[0], *SYMBOL_OPTIONS).pack(side="left", padx=8)
 
     # Timeframe
     row = Frame(basic)
@@ -74,11 +71,10 @@ def build_settings(frame: ttk.Frame, app: App) -> None:
     lbl.pack(side="left")
     ToolTip(lbl, "Size of each candle used by the strategy.\n1m = 1 minute, 5m = 5 minutes, 1h = 1 hour.\nSmaller = more trades but more noise.")
     app.timeframe_var = tk.StringVar(value=app.config_state.timeframe)
-    timeframe_options = ["1m", "5m", "15m", "1h", "4h"]
     if ctk:
-        OptionMenu(row, values=timeframe_options, variable=app.timeframe_var).pack(side="left", padx=8)
+        OptionMenu(row, values=list(TIMEFRAME_OPTIONS), variable=app.timeframe_var).pack(side="left", padx=8)
     else:
-        OptionMenu(row, app.timeframe_var, timeframe_options[1], *timeframe_options).pack(side="left", padx=8)
+        OptionMenu(row, app.timeframe_var, TIMEFRAME_OPTIONS[1], *TIMEFRAME_OPTIONS).pack(side="left", padx=8)
 
     # Poll seconds
     row = Frame(basic)
@@ -86,8 +82,33 @@ def build_settings(frame: ttk.Frame, app: App) -> None:
     lbl = Label(row, text="Poll seconds")
     lbl.pack(side="left")
     ToolTip(lbl, "How often the strategy checks for new data (in seconds).\nLower = more responsive but uses more API calls.")
-    app.poll_var = tk.StringVar(value=str(app.config_state.poll_seconds))
-    Entry(row, textvariable=app.poll_var, width=80 if ctk else 6).pack(side="left", padx=8)
+    # Plain Entry fields skip the Tcl-variable indirection: the widget
+    # itself holds the text and _save_settings reads .get() off it, so no
+    # StringVar allocation or trace wiring per field.
+    app._settings_entries = {}
+    entry = Entry(row, width=80 if ctk else 6)
+    entry.insert(0, str(app.config_state.poll_seconds))
+    entry.pack(side="left", padx=8)
+    app._settings_entries["poll"] = entry
+
+    # The remaining groups (and the Save button that reads their vars) are
+    # built when the tab is first shown: <Map> fires on the first reveal,
+    # so cold start only pays for the widgets above.
+    def _build_rest(_event=None) -> None:
+        if built[0]:
+            return
+        built[0] = True
+        _build_settings_rest(inner, app)
+
+    built = [False]
+    inner.bind("<Map>", _build_rest, add="+")
+
+
+def _build_settings_rest(inner: tk.Widget, app: App) -> None:
+    ctk = app.ctk
+    w = get_widgetset(ctk)
+    Frame, Label, Group = w.Frame, w.Label, w.Group
+    Entry, Button, CheckBox = w.Entry, w.Button, w.CheckBox
 
     # --- CONNECTION SETTINGS ---
     if ctk:
@@ -98,12 +119,12 @@ def build_settings(frame: ttk.Frame, app: App) -> None:
     conn.pack(pady=6, padx=20, fill="x")
 
     app.live_var = tk.BooleanVar(value=app.config_state.live_trading)
-    cb = ctk.CTkCheckBox(conn, text="Live trading (uses real money via API keys)", variable=app.live_var) if ctk else ttk.Checkbutton(conn, text="Live trading (uses real money via API keys)", variable=app.live_var)
+    cb = CheckBox(conn, text="Live trading (uses real money via API keys)", variable=app.live_var)
     cb.pack(anchor="w", pady=2)
     ToolTip(cb, "OFF = paper trading (simulated, no real money).\nON = real orders sent to the exchange. Requires valid API keys.")
 
     app.ws_var = tk.BooleanVar(value=app.config_state.enable_websocket)
-    cb = ctk.CTkCheckBox(conn, text="Enable Coinbase WebSocket (real-time prices)", variable=app.ws_var) if ctk else ttk.Checkbutton(conn, text="Enable Coinbase WebSocket (real-time prices)", variable=app.ws_var)
+    cb = CheckBox(conn, text="Enable Coinbase WebSocket (real-time prices)", variable=app.ws_var)
     cb.pack(anchor="w", pady=2)
     ToolTip(cb, "Get price updates in real-time via WebSocket instead of polling.\nOnly works with Coinbase. Falls back to REST if disabled.")
 
@@ -121,8 +142,10 @@ def build_settings(frame: ttk.Frame, app: App) -> None:
     lbl = Label(row, text="Stop loss (%)")
     lbl.pack(side="left")
     ToolTip(lbl, "Automatically sell if price drops this % below your entry price.\n2% means: bought at $100, auto-sell at $98.\nProtects against large losses.")
-    app.sl_var = tk.StringVar(value=str(app.config_state.stop_loss_pct))
-    Entry(row, textvariable=app.sl_var, width=100 if ctk else 10).pack(side="left", padx=8)
+    entry = Entry(row, width=100 if ctk else 10)
+    entry.insert(0, str(app.config_state.stop_loss_pct))
+    entry.pack(side="left", padx=8)
+    app._settings_entries["sl"] = entry
 
     # Take profit
     row = Frame(risk)
@@ -130,8 +153,10 @@ def build_settings(frame: ttk.Frame, app: App) -> None:
     lbl = Label(row, text="Take profit (%)")
     lbl.pack(side="left")
     ToolTip(lbl, "Automatically sell if price rises this % above your entry price.\n3% means: bought at $100, auto-sell at $103.\nLocks in gains.")
-    app.tp_var = tk.StringVar(value=str(app.config_state.take_profit_pct))
-    Entry(row, textvariable=app.tp_var, width=100 if ctk else 10).pack(side="left", padx=8)
+    entry = Entry(row, width=100 if ctk else 10)
+    entry.insert(0, str(app.config_state.take_profit_pct))
+    entry.pack(side="left", padx=8)
+    app._settings_entries["tp"] = entry
 
     # Max daily loss
     row = Frame(risk)
@@ -139,8 +164,10 @@ def build_settings(frame: ttk.Frame, app: App) -> None:
     lbl = Label(row, text="Max daily loss (USD)")
     lbl.pack(side="left")
     ToolTip(lbl, "Stop all trading for the day if total losses exceed this amount.\nPrevents catastrophic drawdowns from bad market conditions.")
-    app.max_loss_var = tk.StringVar(value=str(app.config_state.max_daily_loss))
-    Entry(row, textvariable=app.max_loss_var, width=100 if ctk else 10).pack(side="left", padx=8)
+    entry = Entry(row, width=100 if ctk else 10)
+    entry.insert(0, str(app.config_state.max_daily_loss))
+    entry.pack(side="left", padx=8)
+    app._settings_entries["max_loss"] = entry
 
     # Cooldown
     row = Frame(risk)
@@ -148,8 +175,10 @@ def build_settings(frame: ttk.Frame, app: App) -> None:
     lbl = Label(row, text="Cooldown seconds")
     lbl.pack(side="left")
     ToolTip(lbl, "Minimum seconds to wait between trades.\nPrevents rapid-fire trading after a signal.\n90s is a safe default.")
-    app.cooldown_var = tk.StringVar(value=str(app.config_state.cooldown_seconds))
-    Entry(row, textvariable=app.cooldown_var, width=100 if ctk else 10).pack(side="left", padx=8)
+    entry = Entry(row, width=100 if ctk else 10)
+    entry.insert(0, str(app.config_state.cooldown_seconds))
+    entry.pack(side="left", padx=8)
+    app._settings_entries["cooldown"] = entry
 
     # Save button
     btn_row = Frame(inner)
@@ -5,23 +5,20 @@ from tkinter import ttk
 from typing import TYPE_CHECKING
 
 from cryptopus.strategies import STRATEGIES
+from cryptopus.ui._widgets import get_widgetset
 from cryptopus.ui.tooltip import ToolTip
 
 if TYPE_CHECKING:
     from cryptopus.ui import App
 
-# Map strategy names to their description text
 _STRATEGY_DESCRIPTIONS = {s.name: s.description for s in STRATEGIES}
 
 
 def build_strategy(frame: ttk.Frame, app: App) -> None:
     ctk = app.ctk
-    Frame = ctk.CTkFrame if ctk else ttk.Frame
-    Label = ctk.CTkLabel if ctk else ttk.Label
-    Button = ctk.CTkButton if ctk else ttk.Button
-    Entry = ctk.CTkEntry if ctk else ttk.Entry
-    OptionMenu = ctk.CTkOptionMenu if ctk else ttk.OptionMenu
-    Group = ctk.CTkFrame if ctk else ttk.LabelFrame
+    w = get_widgetset(ctk)
+    Frame, Label, Group = w.Frame, w.Label, w.Group
+    Entry, OptionMenu, Button = w.Entry, w.OptionMenu, w.Button
 
     app.strategy_var = tk.StringVar(value=STRATEGIES[0].name)
     strategies = [s.name for s in STRATEGIES]
@@ -86,7 +83,7 @@ def build_strategy(frame: ttk.Frame, app: App) -> None:
     atr_row = Frame(frame)
     atr_row.pack(pady=2, padx=20, fill="x")
     app.atr_sizing_var = tk.BooleanVar(value=app.config_state.use_atr_sizing)
-    atr_cb = ctk.CTkCheckBox(atr_row, text="Use ATR-based position sizing", variable=app.atr_sizing_var) if ctk else ttk.Checkbutton(atr_row, text="Use ATR-based position sizing", variable=app.atr_sizing_var)
+    atr_cb = w.CheckBox(atr_row, text="Use ATR-based position sizing", variable=app.atr_sizing_var)
     atr_cb.pack(side="left")
     ToolTip(atr_cb, "Automatically sizes trades based on recent volatility (ATR-14).\nHigher volatility = smaller position to control risk.")
 
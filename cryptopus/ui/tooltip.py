@@ -3,44 +3,97 @@ from __future__ import annotations
 
 import tkinter as tk
 
+# One pair of class-level bindings serves every tooltip: registering a
+# widget costs a bindtags update and a dict insert instead of two
+# widget.bind() round-trips each, which adds up across the settings and
+# strategy builders.
+_REGISTRY: dict[str, "ToolTip"] = {}
+_BINDTAG = "TooltipTarget"
+_installed = False
+
+
+def _install(widget: tk.Widget) -> None:
+    global _installed
+    if _installed:
+        return
+    root = widget.winfo_toplevel()
+    root.bind_class(_BINDTAG, "<Enter>", _dispatch_show)
+    root.bind_class(_BINDTAG, "<Leave>", _dispatch_hide)
+    _installed = True
+
+
+def _dispatch_show(event: tk.Event) -> None:  # type: ignore[type-arg]
+    tip = _REGISTRY.get(str(event.widget))
+    if tip:
+        tip._show(event)
+
+
+def _dispatch_hide(event: tk.Event) -> None:  # type: ignore[type-arg]
+    tip = _REGISTRY.get(str(event.widget))
+    if tip is None:
+        return
+    # Composite widgets (customtkinter labels/checkboxes) fire <Leave> on
+    # the outer frame the moment the pointer crosses onto their inner
+    # child. Tkinter does not expose the crossing detail field, so filter
+    # those by checking whether the pointer is still inside the target.
+    w = tip.widget
+    try:
+        x0, y0 = w.winfo_rootx(), w.winfo_rooty()
+        if (x0 <= event.x_root < x0 + w.winfo_width()
+                and y0 <= event.y_root < y0 + w.winfo_height()):
+            return
+    except tk.TclError:
+        pass
+    tip._hide(event)
+
 
 class ToolTip:
     """Show a tooltip when hovering over a widget."""
 
+    # Settings and strategy tabs create a couple dozen of these; slots
+    # drop the per-instance dict.
+    __slots__ = ("widget", "text", "wrap_length")
+
+    # One popup window serves every tooltip: creating/destroying a native
+    # Toplevel per hover is a window-manager round-trip, while moving and
+    # reconfiguring a withdrawn one is not.
+    _shared_tw: tk.Toplevel | None = None
+    _shared_label: tk.Label | None = None
+
     def __init__(self, widget: tk.Widget, text: str, wrap_length: int = 300) -> None:
         self.widget = widget
         self.text = text
         self.wrap_length = wrap_length
-        self._tip_window: tk.Toplevel | None = None
-        widget.bind("<Enter>", self._show)
-        widget.bind("<Leave>", self._hide)
+        _install(widget)
+        widget.bindtags((_BINDTAG,) + widget.bindtags())
+        _REGISTRY[str(widget)] = self
 
     def _show(self, _event: tk.Event) -> None:  # type: ignore[type-arg]
-        if self._tip_window:
-            return
+        cls = ToolTip
+        if cls._shared_tw is None:
+            cls._shared_tw = tw = tk.Toplevel(self.widget)
+            tw.wm_overrideredirect(True)
+            tw.wm_withdraw()
+            cls._shared_label = tk.Label(
+                tw,
+                justify="left",
+                background="#ffffe0",
+                relief="solid",
+                borderwidth=1,
+                font=("Segoe UI", 9),
+                padx=6,
+                pady=4,
+            )
+            cls._shared_label.pack()
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 4
-        self._tip_window = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
-        label = tk.Label(
-            tw,
-            text=self.text,
-            justify="left",
-            background="#ffffe0",
-            relief="solid",
-            borderwidth=1,
-            wraplength=self.wrap_length,
-            font=("Segoe UI", 9),
-            padx=6,
-            pady=4,
-        )
-        label.pack()
+        cls._shared_label.configure(text=self.text, wraplength=self.wrap_length)
+        cls._shared_tw.wm_geometry(f"+{x}+{y}")
+        cls._shared_tw.wm_deiconify()
 
     def _hide(self, _event: tk.Event) -> None:  # type: ignore[type-arg]
-        if self._tip_window:
-            self._tip_window.destroy()
-            self._tip_window = None
+        if ToolTip._shared_tw is not None:
+            ToolTip._shared_tw.wm_withdraw()
 
     def update_text(self, text: str) -> None:
         self.text = text
@@ -4,7 +4,7 @@ from __future__ import annotations
 import os
 import tkinter as tk
 from tkinter import ttk
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
     from cryptopus.ui import App
@@ -80,6 +80,12 @@ _STEPS = [
     },
 ]
 
+# Flat tuples instead of a list of dicts: navigation indexes straight in
+# with no per-step key lookups.
+_TITLES: Final[tuple[str, ...]] = tuple(s["title"] for s in _STEPS)
+_BODIES: Final[tuple[str, ...]] = tuple(s["body"] for s in _STEPS)
+del _STEPS
+
 
 def should_show_welcome() -> bool:
     return not os.path.exists(_FLAG_FILE)
@@ -111,7 +117,7 @@ def show_welcome(app: App) -> None:
     step_idx = [0]
 
     # Title
-    title_label = ttk.Label(dialog, text=_STEPS[0]["title"], font=("Segoe UI", 14, "bold"))
+    title_label = ttk.Label(dialog, text=_TITLES[0], font=("Segoe UI", 14, "bold"))
     title_label.pack(pady=(16, 8), padx=20)
 
     # Body
@@ -120,11 +126,15 @@ def show_welcome(app: App) -> None:
         relief="flat", bg=dialog.cget("bg"), padx=10, pady=4,
     )
     body_text.pack(fill="both", expand=True, padx=20)
-    body_text.insert("1.0", _STEPS[0]["body"])
+    # All step bodies go in once, each under its own tag; navigation just
+    # flips elide flags instead of rebuilding the text widget's content.
+    for i, body in enumerate(_BODIES):
+        body_text.insert("end", body, (f"step{i}",))
+        body_text.tag_configure(f"step{i}", elide=(i != 0))
     body_text.configure(state="disabled")
 
     # Progress indicator
-    progress_label = ttk.Label(dialog, text=f"1 / {len(_STEPS)}", font=("Segoe UI", 9))
+    progress_label = ttk.Label(dialog, text=f"1 / {len(_TITLES)}", font=("Segoe UI", 9))
     progress_label.pack(pady=(4, 0))
 
     # Buttons
@@ -140,21 +150,18 @@ def show_welcome(app: App) -> None:
         dialog.destroy()
 
     def _update_step() -> None:
-        step = _STEPS[step_idx[0]]
-        title_label.config(text=step["title"])
-        body_text.configure(state="normal")
-        body_text.delete("1.0", "end")
-        body_text.insert("1.0", step["body"])
-        body_text.configure(state="disabled")
-        progress_label.config(text=f"{step_idx[0] + 1} / {len(_STEPS)}")
+        title_label.config(text=_TITLES[step_idx[0]])
+        for i in range(len(_BODIES)):
+            body_text.tag_configure(f"step{i}", elide=(i != step_idx[0]))
+        progress_label.config(text=f"{step_idx[0] + 1} / {len(_TITLES)}")
         back_btn.config(state="normal" if step_idx[0] > 0 else "disabled")
-        if step_idx[0] == len(_STEPS) - 1:
+        if step_idx[0] == len(_TITLES) - 1:
             next_btn.config(text="Get Started!")
         else:
             next_btn.config(text="Next")
 
     def _next() -> None:
-        if step_idx[0] >= len(_STEPS) - 1:
+        if step_idx[0] >= len(_TITLES) - 1:
             _close()
         else:
             step_idx[0] += 1
@@ -1,25 +1,53 @@
 import json
+import random
+import re
+import statistics
 import threading
 import time
 import traceback
-from typing import Callable
-
-try:
-    import websocket  # type: ignore
-except Exception:
-    websocket = None
+from collections import deque
+from typing import Callable, Optional
 
 from cryptopus.logger import Logger
 
 
+def _make_ticker_parser() -> Callable[[object], Optional[str]]:
+    """Build a parser specialized for Coinbase ticker frames.
+
+    The ticker schema is fixed, so a compiled regex scan for the price
+    field replaces the whole JSON tokenizer on the hot path. Frames
+    without a ticker price (heartbeats, subscription acks) return None.
+    """
+    price_s = re.compile(r'"price"\s*:\s*"([^"]+)"').search
+    price_b = re.compile(rb'"price"\s*:\s*"([^"]+)"').search
+
+    def parse(message: object) -> Optional[str]:
+        if isinstance(message, bytes):
+            m = price_b(message) if b'"ticker"' in message else None
+            return m.group(1).decode() if m else None
+        m = price_s(message) if '"ticker"' in message else None  # type: ignore[arg-type]
+        return m.group(1) if m else None
+
+    return parse
+
+
 class WebSocketPriceFeed(threading.Thread):
-    def __init__(self, symbol: str, logger: Logger, on_price: Callable[[str, float], None]) -> None:
+    def __init__(self, symbol: str, logger: Logger, on_price: Callable[[str, float], None],
+                 ping_interval: int = 5) -> None:
         super().__init__(daemon=True)
         self.symbol = symbol
         self.logger = logger
         self.on_price = on_price
+        self.ping_interval = ping_interval
+        self._sub_msg = json.dumps({
+            "type": "subscribe",
+            "product_ids": [symbol.replace("/", "-")],
+            "channels": ["ticker"],
+        })
         self._stop_event = threading.Event()
+        self._parse = _make_ticker_parser()
         self.last_message_time: float = 0.0
+        self._rtts: deque = deque(maxlen=32)
 
     def stop(self) -> None:
         self._stop_event.set()
@@ -27,14 +55,33 @@ class WebSocketPriceFeed(threading.Thread):
     def is_healthy(self) -> bool:
         return (time.time() - self.last_message_time) < 30.0 if self.last_message_time else False
 
+    def ping_rtt(self) -> float:
+        """Median ping round-trip time in seconds, 0.0 before the first pong."""
+        return statistics.median(self._rtts) if self._rtts else 0.0
+
     def run(self) -> None:
+        # Imported here, not at module load: the feed is optional and the
+        # websocket package (plus ssl machinery) is only paid for once this
+        # thread actually starts.
+        try:
+            import websocket  # type: ignore
+        except Exception:
+            self.logger.log("websocket-client not installed; websocket feed disabled.")
+            return
+        ws_app_cls = websocket.WebSocketApp
+
         product_id = self.symbol.replace("/", "-")
         backoff = 1.0
+        # Hot-path locals: on_message runs per ticker frame, so skip the
+        # attribute lookups there.
+        symbol = self.symbol
+        on_price = self.on_price
+        parse = self._parse
+        now = time.time
 
         def on_open(ws):  # type: ignore
             nonlocal backoff
-            sub = {"type": "subscribe", "product_ids": [product_id], "channels": ["ticker"]}
-            ws.send(json.dumps(sub))
+            ws.send(self._sub_msg)
             self.logger.log(f"Websocket subscribed: {product_id}")
             backoff = 1.0
 
@@ -42,15 +89,12 @@ class WebSocketPriceFeed(threading.Thread):
             if self._stop_event.is_set():
                 ws.close()
                 return
+            price = parse(message)
+            if price is None:
+                return
             try:
-                data = json.loads(message)
-                if data.get("type") != "ticker":
-                    return
-                price = data.get("price")
-                if price is None:
-                    return
-                self.last_message_time = time.time()
-                self.on_price(self.symbol, float(price))
+                self.last_message_time = now()
+                on_price(symbol, float(price))
             except Exception as exc:
                 self.logger.log(f"Websocket parse error: {exc}")
 
@@ -60,19 +104,31 @@ class WebSocketPriceFeed(threading.Thread):
         def on_close(ws, *args):  # type: ignore
             self.logger.log("Websocket closed.")
 
+        def on_pong(ws, data):  # type: ignore
+            if ws.last_ping_tm:
+                self._rtts.append(ws.last_pong_tm - ws.last_ping_tm)
+
+        ping_interval = max(self.ping_interval, 3)
+        ping_timeout = max(ping_interval - 2, 2)
         while not self._stop_event.is_set():
             try:
-                ws_app = websocket.WebSocketApp(
+                ws_app = ws_app_cls(
                     "wss://ws-feed.exchange.coinbase.com",
                     on_open=on_open,
                     on_message=on_message,
                     on_error=on_error,
                     on_close=on_close,
+                    on_pong=on_pong,
                 )
-                ws_app.run_forever(ping_interval=20, ping_timeout=10)
+                ws_app.run_forever(ping_interval=ping_interval, ping_timeout=ping_timeout)
+            except (OSError, ConnectionError, websocket.WebSocketException) as exc:
+                # Expected during outages; no point formatting a full
+                # traceback on every reconnect attempt.
+                self.logger.log(f"Websocket connection error: {exc!r}")
             except Exception as exc:
-                self.logger.log(f"Websocket connection error: {exc}\n{traceback.format_exc()}")
+                self.logger.log(f"Websocket unexpected error: {exc}\n{traceback.format_exc()}")
             if not self._stop_event.is_set():
                 self.logger.log(f"Websocket reconnecting in {backoff:.0f}s...")
-                time.sleep(backoff)
+                # Jitter avoids thundering-herd reconnects after an outage.
+                time.sleep(backoff + random.uniform(0, 1))
                 backoff = min(backoff * 2, 60.0)
@@ -0,0 +1,63 @@
+"""Shared fixtures for the test suite."""
+from collections import deque
+
+import numpy as np
+import pytest
+
+from cryptopus.config import AppConfig
+from cryptopus.logger import Logger
+from cryptopus.trader import Trader
+
+
+class _StubDataEngine:
+    """Hand-rolled DataEngine stand-in; construction is near-free.
+
+    Paper-trading paths only read .exchange; anything else called on it
+    becomes a harmless no-op.
+    """
+
+    def __init__(self):
+        self.exchange = None
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+@pytest.fixture(scope="session")
+def _flat_candles_buf():
+    """100 flat candles at price 100, built once as an (N, 6) array."""
+    base_ts = 1_000_000_000_000
+    arr = np.empty((100, 6), dtype=np.float64)
+    arr[:, 0] = base_ts + np.arange(100) * 60_000
+    arr[:, 1] = 100.0
+    arr[:, 2] = 100.01
+    arr[:, 3] = 99.99
+    arr[:, 4] = 100.0
+    arr[:, 5] = 100.0
+    return arr
+
+
+@pytest.fixture
+def flat_candles(_flat_candles_buf):
+    """Slice-and-copy factory over the shared buffer.
+
+    The copy keeps per-test mutations (spiking a close, widening a high)
+    from leaking into other tests, while the buffer itself is only
+    filled once per session.
+    """
+    def slicer(n, price=100.0):
+        candles = _flat_candles_buf[:n].copy()
+        if price != 100.0:
+            candles[:, 1:5] += price - 100.0
+        return candles
+    return slicer
+
+
+@pytest.fixture
+def make_trader():
+    """Factory building a fresh Trader around a stub data engine."""
+    def factory(store=None, events=None):
+        config = AppConfig(live_trading=False)
+        logger = Logger(deque(maxlen=1000))
+        return Trader(config, _StubDataEngine(), logger, store=store, events=events)
+    return factory
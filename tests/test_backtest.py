@@ -1,4 +1,6 @@
 """Tests for the BacktestEngine."""
+import numpy as np
+
 from cryptopus.backtest import BacktestEngine, BacktestResult
 from cryptopus.strategies import MomentumStrategy
 
@@ -8,13 +10,18 @@ def _make_candle(ts: float, o: float, h: float, l: float, c: float, v: float = 1
 
 
 def _make_trending_candles(n: int, start_price: float = 100.0, trend: float = 0.5):
-    """Generate n candles with a steady trend."""
+    """Generate n candles with a steady trend.
+
+    Returns a plain list of rows so tests can keep appending crash/spike
+    candles; the columns are built vectorized.
+    """
     base_ts = 1_000_000_000_000
-    candles = []
-    for i in range(n):
-        p = start_price + i * trend
-        candles.append(_make_candle(base_ts + i * 60_000, p, p + 1.0, p - 1.0, p))
-    return candles
+    idx = np.arange(n, dtype=np.float64)
+    ts = base_ts + idx * 60_000
+    prices = start_price + idx * trend
+    return np.column_stack(
+        [ts, prices, prices + 1.0, prices - 1.0, prices, np.full(n, 100.0)]
+    ).tolist()
 
 
 class TestBacktestEngine:
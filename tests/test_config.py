@@ -1,5 +1,7 @@
 """Tests for config validation."""
-from cryptopus.config import validate_config, AppConfig
+import json
+
+from cryptopus.config import validate_config, load_validated_config, AppConfig
 
 
 class TestValidateConfig:
@@ -41,6 +43,23 @@ class TestValidateConfig:
         assert any("apiKey is not a string" in m for m in logs)
 
 
+class TestLoadValidatedConfig:
+    def test_missing_file_returns_empty(self, tmp_path):
+        logs = []
+        result = load_validated_config(str(tmp_path / "nope.json"), logs.append)
+        assert result == {}
+
+    def test_unchanged_file_validated_once(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"exchanges": {"kraken": {"apiKey": 123}}}))
+        logs = []
+        first = load_validated_config(str(path), logs.append)
+        warnings_after_first = len(logs)
+        second = load_validated_config(str(path), logs.append)
+        assert second == first
+        assert len(logs) == warnings_after_first  # no duplicate warnings
+
+
 class TestAppConfig:
     def test_defaults(self):
         config = AppConfig()
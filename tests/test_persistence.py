@@ -30,11 +30,13 @@ class TestTradeStore:
 
     def test_load_orders_limit(self):
         store = _make_store()
-        for i in range(10):
-            store.save_order(Order(
+        store.save_orders([
+            Order(
                 ts=datetime(2025, 1, 1, tzinfo=timezone.utc),
                 side="buy", price=100.0 + i, amount=1.0, status="paper", symbol="BTC/USD",
-            ))
+            )
+            for i in range(10)
+        ])
         orders = store.load_orders(limit=5)
         assert len(orders) == 5
 
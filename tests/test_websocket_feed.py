@@ -0,0 +1,51 @@
+"""Tests for the specialized websocket ticker parser."""
+import json
+
+from cryptopus.websocket_feed import _make_ticker_parser
+
+_TICKER = json.dumps({
+    "type": "ticker",
+    "sequence": 12345,
+    "product_id": "BTC-USD",
+    "price": "64123.45",
+    "best_bid": "64123.00",
+    "best_ask": "64124.00",
+    "time": "2025-01-01T00:00:00.000000Z",
+})
+_HEARTBEAT = json.dumps({
+    "type": "heartbeat",
+    "sequence": 12346,
+    "product_id": "BTC-USD",
+    "time": "2025-01-01T00:00:01.000000Z",
+})
+_SUB_ACK = json.dumps({
+    "type": "subscriptions",
+    "channels": [{"name": "ticker", "product_ids": ["BTC-USD"]}],
+})
+
+
+class TestTickerParser:
+    def test_extracts_price_from_ticker(self):
+        parse = _make_ticker_parser()
+        assert parse(_TICKER) == "64123.45"
+        assert float(parse(_TICKER)) == float(json.loads(_TICKER)["price"])
+
+    def test_handles_bytes_frames(self):
+        parse = _make_ticker_parser()
+        assert parse(_TICKER.encode()) == "64123.45"
+
+    def test_ignores_heartbeat(self):
+        parse = _make_ticker_parser()
+        assert parse(_HEARTBEAT) is None
+        assert parse(_HEARTBEAT.encode()) is None
+
+    def test_ignores_subscription_ack(self):
+        parse = _make_ticker_parser()
+        assert parse(_SUB_ACK) is None
+
+    def test_matches_json_loads_on_corpus(self):
+        parse = _make_ticker_parser()
+        for raw in (_TICKER, _HEARTBEAT, _SUB_ACK):
+            data = json.loads(raw)
+            expected = data.get("price") if data.get("type") == "ticker" else None
+            assert parse(raw) == expected